@@ -32,6 +32,11 @@ class Settings(BaseSettings):
         default=["https://www.googleapis.com/auth/calendar"],
         description="Google API scopes"
     )
+    google_event_id_hash: str = Field(
+        default="sha256",
+        description="Hash used to derive Google event IDs from UIDs: 'sha256' (legacy) or 'blake2b'. "
+                    "Changing it changes the derived ID of every event."
+    )
     
     # iCloud Calendar Configuration (CalDAV)
     icloud_username: str = Field(..., description="iCloud username/email")
@@ -88,7 +93,7 @@ class Settings(BaseSettings):
     rate_limit_requests_per_minute: int = Field(
         default=300,
         ge=1,
-        description="Rate limit for API requests"
+        description="Rate limit for API requests (token bucket; bursts up to max_concurrent_requests)"
     )
     
     # Webhook Configuration
@@ -141,6 +146,15 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v.upper()
     
+    @field_validator('google_event_id_hash')
+    @classmethod
+    def validate_google_event_id_hash(cls, v):
+        """Validate event ID hash algorithm."""
+        valid_hashes = ['sha256', 'blake2b']
+        if v.lower() not in valid_hashes:
+            raise ValueError(f"Google event ID hash must be one of: {valid_hashes}")
+        return v.lower()
+    
     @field_validator('google_client_id')
     @classmethod
     def validate_google_client_id(cls, v):
@@ -1,9 +1,11 @@
 """Base calendar service interface with async support."""
 
 import asyncio
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, AsyncIterator
+from typing import Any, Callable, Dict, List, Optional, AsyncIterator, TypeVar
 import logging
 
 from ..models import CalendarEvent, CalendarInfo, EventSource, ChangeSet
@@ -11,6 +13,8 @@ from ..config import Settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class CalendarServiceError(Exception):
     """Base exception for calendar service errors."""
@@ -37,6 +41,47 @@ class EventNotFoundError(CalendarServiceError):
     pass
 
 
+class AsyncTokenBucket:
+    """Async token-bucket rate limiter shared by all coroutines of a service."""
+    
+    def __init__(self, rate_per_second: float, capacity: int):
+        """Initialize token bucket.
+        
+        Args:
+            rate_per_second: Tokens added to the bucket per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill: Optional[float] = None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._last_refill is not None:
+                    elapsed = now - self._last_refill
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self) -> 'AsyncTokenBucket':
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
 class BaseCalendarService(ABC):
     """Abstract base class for calendar services with async support."""
     
@@ -54,6 +99,26 @@ class BaseCalendarService(ABC):
         self._rate_limiter = asyncio.Semaphore(
             settings.rate_limit_requests_per_minute // 60
         )
+        # Dedicated pool sized for concurrent blocking client calls; the loop's
+        # default executor is smaller and shared with unrelated work
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.max_concurrent_requests,
+            thread_name_prefix=source.value
+        )
+    
+    async def _to_thread(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function on the service's I/O thread pool.
+        
+        Like asyncio.to_thread, but on the dedicated executor rather than the
+        loop's default one.
+        """
+        if kwargs:
+            func = functools.partial(func, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
+    async def close(self) -> None:
+        """Release resources held by the service."""
+        self._executor.shutdown(wait=False)
     
     @abstractmethod
     async def authenticate(self) -> None:
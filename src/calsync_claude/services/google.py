@@ -1,25 +1,317 @@
 """Google Calendar service implementation with async support."""
 
 import asyncio
+import functools
+import hashlib
+import io
 import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, AsyncIterator, Tuple, Set
+import logging
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.feedparser import FeedParser
+from email.generator import Generator
+from email.mime.multipart import MIMEMultipart
+from email.mime.nonmultipart import MIMENonMultipart
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Mapping, Optional, AsyncIterator, Tuple, Set
 from pathlib import Path
+from types import MappingProxyType
 
+from dateutil.parser import isoparse, parse as parse_date
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from googleapiclient.errors import BatchError, HttpError
+from googleapiclient.http import BatchHttpRequest, HttpRequest
+from googleapiclient.model import JsonModel
+import httplib2
 import httpx
-import pytz
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from .base import BaseCalendarService, CalendarServiceError, AuthenticationError, EventNotFoundError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    _HTTP2_AVAILABLE = False
+
+from .base import (
+    AsyncTokenBucket, BaseCalendarService, CalendarServiceError, AuthenticationError, EventNotFoundError
+)
 from ..models import CalendarEvent, CalendarInfo, EventSource, ChangeSet
 from ..config import Settings
 
 
+# Shared read-only fallback for missing nested objects in API payloads
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Access roles that allow creating events on a calendar
+_WRITABLE_ROLES = frozenset({'owner', 'writer'})
+
+# Optional fields written by _convert_to_google_format that must be cleared
+# explicitly when an update is sent as a PATCH
+_CLEARABLE_EVENT_FIELDS = ('recurrence', 'attendees')
+
+# Text fields Google leaves out of responses when they are empty
+_TEXT_EVENT_FIELDS = frozenset({'summary', 'description', 'location'})
+
+# Calendar list and metadata rarely change during a sync run
+CALENDAR_CACHE_TTL_SECONDS = 300
+
+# Largest page size events.list accepts; fewer pages means fewer round trips
+EVENTS_PAGE_SIZE = 2500
+
+# Partial response for events.list: every field _format_google_event and the
+# sync engine read (selfLink via original_data), plus paging/sync tokens
+EVENT_LIST_FIELDS = (
+    'items(id,iCalUID,status,summary,description,location,start,end,created,updated,'
+    'etag,sequence,recurringEventId,recurrence,originalStartTime,organizer,'
+    'attendees(email,displayName,responseStatus,organizer),selfLink),'
+    'nextPageToken,nextSyncToken'
+)
+
+# The only raw fields kept on CalendarEvent.original_data; the sync engine
+# reads selfLink and originalStartTime, everything else is already parsed
+_ORIGINAL_DATA_FIELDS = ('id', 'etag', 'selfLink', 'recurringEventId', 'originalStartTime')
+
+# Access tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=4)
+
+# Idle pooled connections to googleapis.com are kept this long
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# Google accepts at most 50 sub-requests per multipart batch call
+BATCH_MAX_REQUESTS = 50
+BATCH_URI = 'https://www.googleapis.com/batch/calendar/v3'
+# How long the first queued request waits for others before a partial batch is sent
+BATCH_FLUSH_DELAY_SECONDS = 0.1
+
+# Transient Google API failures are retried with decorrelated jitter, or after
+# the server's Retry-After when it sends one
+RETRY_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 32.0
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Headless containers can't open a browser for the OAuth flow
+_IS_DOCKER = Path('/.dockerenv').exists() or os.environ.get('DOCKER_CONTAINER') == 'true'
+
+# Pages larger than this are formatted in a worker thread to keep the loop responsive
+FORMAT_OFFLOAD_THRESHOLD = 1000
+
+# RFC2938 base32hex alphabet - the only characters Google accepts in event IDs
+_BASE32HEX_ALPHABET = '0123456789abcdefghijklmnopqrstuv'
+_BASE32HEX_CHARS = frozenset(_BASE32HEX_ALPHABET)
+_B32HEX = _BASE32HEX_ALPHABET.encode('ascii')
+_FIRST_CHAR_FIX = bytes.maketrans(b'0123456789', b'abcdefghij')
+# Generated IDs are 32 base32hex characters, i.e. the first 20 digest bytes
+_EVENT_ID_DIGEST_BYTES = 20
+# Every 10-bit value mapped to its two base32hex characters
+_B32HEX_PAIRS = [bytes((_B32HEX[i >> 5], _B32HEX[i & 31])) for i in range(1024)]
+_PAIR_SHIFTS = tuple(range(_EVENT_ID_DIGEST_BYTES * 8 - 10, -1, -10))
+_GOOGLE_EVENT_ID_RE = re.compile(r'^[0-9a-v]{5,1024}$')
+# Large enough to hold every UID of a big account across sync cycles; an LRU
+# smaller than the working set is scanned through in order and never hits
+EVENT_ID_CACHE_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=EVENT_ID_CACHE_SIZE)
+def _uid_to_event_id(uid: str, algorithm: str = 'sha256') -> str:
+    """Map an iCal UID to a stable base32hex Google event ID (pure, cached).
+    
+    The hash is only used for deterministic ID derivation, not security.
+    'sha256' is the legacy scheme that existing events were created with;
+    'blake2b' produces exactly the 20 bytes we encode.
+    """
+    # Create hash from UID
+    if algorithm == 'blake2b':
+        hash_bytes = hashlib.blake2b(uid.encode(), digest_size=_EVENT_ID_DIGEST_BYTES).digest()
+    else:
+        hash_bytes = hashlib.sha256(uid.encode()).digest()
+    
+    # Table-driven base32hex encoding: the 160 bits we keep are read 10 at a
+    # time, each lookup emitting two characters. This is identical to
+    # bit-string encoding the full digest and truncating to 32 characters.
+    bits = int.from_bytes(hash_bytes[:_EVENT_ID_DIGEST_BYTES], 'big')
+    out = bytearray(b''.join([_B32HEX_PAIRS[(bits >> shift) & 1023] for shift in _PAIR_SHIFTS]))
+    
+    # Ensure starts with a letter to avoid potential backend issues
+    # (0->a, 1->b, etc.)
+    out[0] = _FIRST_CHAR_FIX[out[0]]
+    return out.decode('ascii')
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the 'Z' suffix natively from 3.11 on
+    _parse_rfc3339 = datetime.fromisoformat
+else:
+    try:
+        # C parser that handles 'Z' without rewriting the string
+        from ciso8601 import parse_datetime as _parse_rfc3339
+    except ImportError:  # pragma: no cover - optional speedup
+        def _parse_rfc3339(value: str) -> datetime:
+            """Parse an RFC3339 timestamp as returned by the Google API."""
+            if value.endswith('Z'):
+                return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+            return datetime.fromisoformat(value)
+
+
+def _format_date(value: datetime) -> str:
+    """Format a date as YYYY-MM-DD without going through strftime."""
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
+def _event_field_unchanged(key: str, ours: Any, theirs: Any) -> bool:
+    """Whether a field from _convert_to_google_format matches the server copy.
+    
+    Google omits empty text fields, adds a timeZone to start/end and may
+    render the same instant with another offset, so those aren't differences.
+    """
+    if key in _TEXT_EVENT_FIELDS:
+        return (ours or '') == (theirs or '')
+    if key not in ('start', 'end') or not isinstance(ours, dict) or not isinstance(theirs, dict):
+        return ours == theirs
+    if 'date' in ours:
+        return ours['date'] == theirs.get('date') and not theirs.get('dateTime')
+    if 'timeZone' in ours and ours['timeZone'] != theirs.get('timeZone'):
+        return False
+    theirs_time = theirs.get('dateTime')
+    if not theirs_time:
+        return False
+    try:
+        return _parse_rfc3339(ours['dateTime']) == _parse_rfc3339(theirs_time)
+    except ValueError:
+        return ours['dateTime'] == theirs_time
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failure is transient: a connection error or timeout, or an
+    API error with 5xx, 429 or a 403 rate-limit reason."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if not isinstance(error, HttpError):
+        return False
+    status = error.resp.status
+    if status in _RETRYABLE_STATUSES:
+        return True
+    if status != 403:
+        return False
+    content = error.content or b''
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'replace')
+    return b'ratelimitexceeded' in content.lower()
+
+
+def _retry_delay(error: Exception, previous: float) -> float:
+    """Seconds to wait before retrying, honouring a numeric Retry-After header."""
+    retry_after = error.resp.get('retry-after') if isinstance(error, HttpError) else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; fall back to jitter
+    # Decorrelated jitter keeps concurrent retries from waking up together
+    return min(RETRY_MAX_DELAY_SECONDS, random.uniform(RETRY_BASE_DELAY_SECONDS, previous * 3))
+
+
+def _write_private_file(path: Path, content: str) -> None:
+    """Write content to path readable only by the owner (0600, parent 0700)."""
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    # New files are created 0600 up front, so the secret is never briefly
+    # world-readable; only a pre-existing file can need its mode fixed
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        if os.fstat(fd).st_mode & 0o777 != 0o600:
+            path.chmod(0o600)
+        f.write(content)
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that encodes and decodes JSON with orjson when it is installed."""
+
+    def serialize(self, body_value):
+        if orjson is None:
+            return super().serialize(body_value)
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        try:
+            body = orjson.dumps(body_value).decode()
+        except TypeError:
+            return super().serialize(body_value)
+        # Batch bodies are embedded in MIME parts; keep the stdlib's
+        # ASCII-escaped output whenever orjson emitted raw UTF-8
+        if not body.isascii():
+            return super().serialize(body_value)
+        return body
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def _to_httplib2_response(response: httpx.Response) -> httplib2.Response:
+    """Wrap an httpx response the way googleapiclient's models expect."""
+    resp = httplib2.Response({'status': response.status_code, **response.headers})
+    resp.reason = response.reason_phrase
+    return resp
+
+
+class _MultipartBatch(BatchHttpRequest):
+    """BatchHttpRequest split into body encoding and response decoding.
+    
+    BatchHttpRequest.execute() sends through the service's shared httplib2
+    connection, which isn't safe to drive from several threads at once; the
+    service sends the encoded body on its async HTTP client instead, reusing
+    the library's per-request MIME (de)serialisation.
+    """
+    
+    def encode(self) -> Tuple[str, str]:
+        """Return the multipart/mixed body and its Content-Type header."""
+        message = MIMEMultipart('mixed')
+        # The container's own headers go in the HTTP request, not the body
+        setattr(message, '_write_headers', lambda self: None)
+        for request_id in self._order:
+            part = MIMENonMultipart('application', 'http')
+            part['Content-Transfer-Encoding'] = 'binary'
+            part['Content-ID'] = self._id_to_header(request_id)
+            part.set_payload(self._serialize_request(self._requests[request_id]))
+            message.attach(part)
+        
+        fp = io.StringIO()
+        Generator(fp, mangle_from_=False).flatten(message, unixfrom=False)
+        return fp.getvalue(), f'multipart/mixed; boundary="{message.get_boundary()}"'
+    
+    def decode(self, content_type: str, content: bytes) -> Dict[str, Tuple[httplib2.Response, bytes]]:
+        """Split a batch response into (response, content) per request ID."""
+        parser = FeedParser()
+        parser.feed(f"content-type: {content_type}\r\n\r\n{content.decode('utf-8')}")
+        mime_response = parser.close()
+        if not mime_response.is_multipart():
+            raise BatchError("Response not in multipart/mixed format.", content=content)
+        
+        responses = {}
+        for part in mime_response.get_payload():
+            request_id = self._header_to_id(part['Content-ID'])
+            resp, body = self._deserialize_response(part.get_payload())
+            responses[request_id] = (resp, body.encode('utf-8') if isinstance(body, str) else body)
+        return responses
+
+
 class GoogleCalendarService(BaseCalendarService):
     """Google Calendar service with async support."""
     
@@ -31,7 +323,31 @@ class GoogleCalendarService(BaseCalendarService):
         """
         super().__init__(settings, EventSource.GOOGLE)
         self.service = None
+        self._credentials: Optional[Credentials] = None
+        self._token_lock = asyncio.Lock()
         self._http_client = None
+        # Pre-emptive client-side limiting keeps us under the per-user quota
+        # instead of reacting to 429s with exponential backoff
+        self._api_limiter = AsyncTokenBucket(
+            rate_per_second=settings.rate_limit_requests_per_minute / 60,
+            capacity=settings.max_concurrent_requests
+        )
+        # The token bucket bounds the request rate; this bounds how many are
+        # in flight, matching the HTTP pool so requests queue here rather
+        # than timing out waiting for a pooled connection
+        self._api_semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+        self._cal_list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._calendar_meta_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._missing_calendar_cache: Dict[str, Tuple[float, HttpError]] = {}
+        # Requested calendar ID -> ID that _validate_calendar_id resolved it to
+        self._validated_calendars: Dict[str, str] = {}
+        self._pending_batch: List[Tuple[HttpRequest, 'asyncio.Future[Any]']] = []
+        self._batch_flush_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set['asyncio.Task[None]'] = set()
+        # (calendar_id, YYYY-MM-DD) -> content index for _find_events_by_content
+        self._content_index_cache: Dict[
+            Tuple[str, str], Dict[Tuple[str, str, bool], List[Dict[str, Any]]]
+        ] = {}
     
     async def authenticate(self) -> None:
         """Authenticate with Google Calendar API."""
@@ -49,8 +365,11 @@ class GoogleCalendarService(BaseCalendarService):
             # If there are no valid credentials available, authenticate
             if not creds or not creds.valid:
                 if creds and creds.expired and creds.refresh_token:
-                    # Refresh expired credentials
-                    creds.refresh(Request())
+                    # Refresh expired credentials off the loop, sharing the
+                    # lock with _ensure_token so refreshes never overlap
+                    async with self._token_lock:
+                        if creds.expired:
+                            await self._to_thread(creds.refresh, Request())
                 else:
                     # Create credentials file for OAuth flow
                     await self._create_credentials_file()
@@ -61,10 +380,7 @@ class GoogleCalendarService(BaseCalendarService):
                     )
                     
                     # Check if running in Docker (headless) or local environment
-                    import os
-                    is_docker = os.path.exists('/.dockerenv') or os.environ.get('DOCKER_CONTAINER') == 'true'
-                    
-                    if is_docker:
+                    if _IS_DOCKER:
                         # Headless Docker environment - provide setup instructions
                         self.logger.error(
                             f"\n{'='*80}\n"
@@ -90,21 +406,32 @@ class GoogleCalendarService(BaseCalendarService):
                         creds = flow.run_local_server(port=0)
                         self.logger.info("OAuth flow completed successfully")
                 
-                # Save credentials for next run with secure permissions
-                token_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
-                # Set secure file permissions (owner read/write only)
-                token_path.chmod(0o600)
-            
-            # Build the service
-            self.service = build('calendar', 'v3', credentials=creds)
+                # Save credentials for next run with secure permissions, off the event loop
+                await self._to_thread(_write_private_file, token_path, creds.to_json())
+            
+            # Build the service from the discovery document bundled with the
+            # client library; no network fetch and no discovery cache lookup
+            self._credentials = creds
+            self.service = build(
+                'calendar', 'v3',
+                credentials=creds,
+                model=_OrjsonModel(),
+                cache_discovery=False,
+                static_discovery=True
+            )
             
-            # Initialize HTTP client for async requests
+            # Shared async client: single requests go out on its pooled
+            # connections instead of a worker thread each. With h2 installed,
+            # concurrent requests multiplex over one HTTP/2 connection.
             self._http_client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
                 timeout=self.settings.request_timeout_seconds,
                 limits=httpx.Limits(
-                    max_connections=self.settings.max_concurrent_requests
+                    max_connections=self.settings.max_concurrent_requests,
+                    # Keep every pooled connection warm between sync phases
+                    # rather than re-handshaking TLS with googleapis.com
+                    max_keepalive_connections=self.settings.max_concurrent_requests,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS
                 )
             )
             
@@ -114,13 +441,199 @@ class GoogleCalendarService(BaseCalendarService):
         except Exception as e:
             raise AuthenticationError(f"Google Calendar authentication failed: {e}")
     
+    async def _execute(self, request: HttpRequest) -> Any:
+        """Execute a Google API request on the async HTTP client, respecting the rate limit.
+        
+        googleapiclient only builds the request (URL, method, body, headers);
+        the round trip goes through the shared httpx client and the response
+        is decoded by the request's own model, so errors surface as HttpError
+        exactly as with request.execute(). Transient failures, including
+        connection errors and timeouts (which httplib2 used to retry), are
+        retried up to RETRY_MAX_ATTEMPTS times.
+        
+        Args:
+            request: Prepared googleapiclient request
+            
+        Returns:
+            Decoded API response
+        """
+        delay = RETRY_BASE_DELAY_SECONDS
+        for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
+            try:
+                async with self._api_semaphore, self._api_limiter:
+                    return await self._send(request)
+            except (HttpError, httpx.TransportError) as e:
+                if attempt == RETRY_MAX_ATTEMPTS or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(e, delay)
+                self.logger.debug(
+                    "Google API request failed (%s), retrying in %.1fs (attempt %d/%d)",
+                    e.resp.status if isinstance(e, HttpError) else type(e).__name__,
+                    delay, attempt, RETRY_MAX_ATTEMPTS
+                )
+                await asyncio.sleep(delay)
+    
+    async def _ensure_token(self) -> Credentials:
+        """Return credentials whose access token outlives TOKEN_REFRESH_MARGIN.
+        
+        Refreshing ahead of expiry avoids mid-sync 401s; the lock makes
+        concurrent requests share a single refresh.
+        """
+        creds = self._credentials
+        if not self._needs_refresh(creds):
+            return creds
+        async with self._token_lock:
+            # Another request may have refreshed while we waited for the lock
+            if self._needs_refresh(creds):
+                # Token refresh is a blocking call through google-auth's transport
+                await self._to_thread(creds.refresh, Request())
+        return creds
+    
+    @classmethod
+    def _needs_refresh(cls, creds: Credentials) -> bool:
+        """Whether creds must be refreshed before the next request.
+        
+        Without a refresh token an access token can't be renewed early, so
+        it is used until it actually expires.
+        """
+        if not creds.valid:
+            return True
+        return bool(creds.refresh_token) and cls._token_expires_soon(creds)
+    
+    @staticmethod
+    def _token_expires_soon(creds: Credentials) -> bool:
+        """Whether the access token expires within TOKEN_REFRESH_MARGIN."""
+        # google-auth stores expiry as a naive UTC datetime
+        if creds.expiry is None:
+            return False
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - now < TOKEN_REFRESH_MARGIN
+    
+    async def _refresh_rejected_token(self, rejected_token: Optional[str]) -> None:
+        """Refresh credentials after the API rejected rejected_token with a 401."""
+        creds = self._credentials
+        async with self._token_lock:
+            # Concurrent 401s for the same token share a single refresh
+            if creds.token == rejected_token:
+                await self._to_thread(creds.refresh, Request())
+    
+    async def _send(self, request: HttpRequest) -> Any:
+        """Send a prepared request over the pooled async HTTP client."""
+        creds = await self._ensure_token()
+        
+        for attempt in range(2):
+            token = creds.token
+            headers = dict(request.headers)
+            creds.apply(headers)
+            response = await self._http_client.request(
+                request.method,
+                request.uri,
+                content=request.body,
+                headers=headers
+            )
+            # A token revoked or expired early is refreshed once and the request resent
+            if response.status_code != 401 or attempt or not creds.refresh_token:
+                break
+            await self._refresh_rejected_token(token)
+        
+        # The model's postproc expects an httplib2-style response
+        return request.postproc(_to_httplib2_response(response), response.content)
+    
+    async def _execute_batched(self, request: HttpRequest) -> Any:
+        """Queue a Google API request to be sent in the next multipart batch.
+        
+        The queue is flushed once BATCH_MAX_REQUESTS requests are pending or
+        BATCH_FLUSH_DELAY_SECONDS after the first one was queued. Requests only
+        share a batch when callers issue them concurrently, as the batch_*
+        helpers do; the sync engine writes one event at a time through the
+        unbatched methods, so batching is library API for bulk callers.
+        
+        Args:
+            request: Prepared googleapiclient request
+            
+        Returns:
+            Decoded API response
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_batch.append((request, future))
+        
+        if len(self._pending_batch) >= BATCH_MAX_REQUESTS:
+            self._start_batch_flush()
+        elif self._batch_flush_timer is None:
+            self._batch_flush_timer = loop.call_later(
+                BATCH_FLUSH_DELAY_SECONDS, self._start_batch_flush
+            )
+        
+        try:
+            return await future
+        except (HttpError, httpx.TransportError) as e:
+            if isinstance(e, HttpError) and e.resp.status == 401:
+                # Rejected token; _execute refreshes it and resends
+                return await self._execute(request)
+            if not _is_retryable(e):
+                raise
+            # A transient failure of one sub-request (or of the whole batch)
+            # is retried on its own rather than failing the caller outright
+            await asyncio.sleep(_retry_delay(e, RETRY_BASE_DELAY_SECONDS))
+            return await self._execute(request)
+    
+    def _start_batch_flush(self) -> None:
+        """Hand all pending batched requests to a background send task."""
+        if self._batch_flush_timer is not None:
+            self._batch_flush_timer.cancel()
+            self._batch_flush_timer = None
+        
+        pending, self._pending_batch = self._pending_batch, []
+        if pending:
+            task = asyncio.ensure_future(self._send_batch(pending))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _send_batch(self, pending: List[Tuple[HttpRequest, 'asyncio.Future[Any]']]) -> None:
+        """Send queued requests as one multipart batch and resolve their futures."""
+        try:
+            batch = _MultipartBatch(batch_uri=BATCH_URI)
+            for index, (request, _) in enumerate(pending):
+                batch.add(request, request_id=str(index))
+            
+            # Quota is charged per sub-request, not per batch
+            for _ in pending:
+                await self._api_limiter.acquire()
+            creds = await self._ensure_token()
+            
+            body, content_type = batch.encode()
+            headers = {'content-type': content_type}
+            creds.apply(headers)
+            async with self._api_semaphore:
+                response = await self._http_client.post(BATCH_URI, content=body, headers=headers)
+            if response.status_code >= 300:
+                raise HttpError(_to_httplib2_response(response), response.content, uri=BATCH_URI)
+            responses = batch.decode(response.headers['content-type'], response.content)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for index, (request, future) in enumerate(pending):
+            if future.done():
+                continue
+            if str(index) not in responses:
+                future.set_exception(CalendarServiceError("No response for batched request"))
+                continue
+            resp, content = responses[str(index)]
+            try:
+                if resp.status >= 300:
+                    raise HttpError(resp, content, uri=request.uri)
+                future.set_result(request.postproc(resp, content))
+            except Exception as e:
+                future.set_exception(e)
+    
     async def _create_credentials_file(self) -> None:
         """Create Google OAuth credentials file."""
         # Check if running in Docker (headless) or local environment
-        import os
-        is_docker = os.path.exists('/.dockerenv') or os.environ.get('DOCKER_CONTAINER') == 'true'
-        
-        if is_docker:
+        if _IS_DOCKER:
             # For headless/server deployment, use OOB (though deprecated)
             redirect_uris = ["urn:ietf:wg:oauth:2.0:oob"]
         else:
@@ -138,27 +651,19 @@ class GoogleCalendarService(BaseCalendarService):
             }
         }
         
-        credentials_path = self.settings.google_credentials_path
-        credentials_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-        
-        with open(credentials_path, 'w') as f:
-            json.dump(credentials_data, f)
-        # Set secure file permissions (owner read/write only)
-        credentials_path.chmod(0o600)
+        await self._to_thread(
+            _write_private_file,
+            self.settings.google_credentials_path,
+            json.dumps(credentials_data)
+        )
     
     async def get_calendars(self) -> List[CalendarInfo]:
         """Get list of Google calendars."""
         self._ensure_authenticated()
         
         try:
-            # Run synchronous API call in thread pool
-            calendar_list = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.calendarList().list().execute()
-            )
-            
             calendars = []
-            for cal_data in calendar_list.get('items', []):
+            for cal_data in await self._list_calendar_items():
                 calendar_info = CalendarInfo(
                     id=cal_data['id'],
                     name=cal_data.get('summary', 'Unnamed Calendar'),
@@ -179,6 +684,84 @@ class GoogleCalendarService(BaseCalendarService):
         except Exception as e:
             raise CalendarServiceError(f"Failed to get Google calendars: {e}")
     
+    async def _list_calendar_items(self) -> List[Dict[str, Any]]:
+        """Return raw calendarList items, cached for CALENDAR_CACHE_TTL_SECONDS."""
+        cache = self._cal_list_cache
+        if cache and time.monotonic() - cache[0] < CALENDAR_CACHE_TTL_SECONDS:
+            return cache[1]
+        
+        calendar_list = await self._execute(
+            self.service.calendarList().list()
+        )
+        items = calendar_list.get('items', [])
+        self._cal_list_cache = (time.monotonic(), items)
+        return items
+    
+    def invalidate_calendar_cache(self) -> None:
+        """Drop cached calendar metadata so the next lookup hits the API."""
+        self._cal_list_cache = None
+        self._calendar_meta_cache.clear()
+        self._missing_calendar_cache.clear()
+        self._validated_calendars.clear()
+    
+    def invalidate_content_index(self, calendar_id: Optional[str] = None) -> None:
+        """Drop cached content indexes, for one calendar or all of them.
+        
+        The sync engine clears them at the start of each sync pass, since the
+        calendars may have changed on the server between passes.
+        """
+        if calendar_id is None:
+            self._content_index_cache.clear()
+            return
+        for key in [key for key in self._content_index_cache if key[0] == calendar_id]:
+            del self._content_index_cache[key]
+    
+    def _forget_event_days(self, calendar_id: str, *events: Mapping[str, Any]) -> None:
+        """Drop the content indexes for the start days of Google event payloads."""
+        for event in events:
+            start = event.get('start') or _EMPTY
+            day = start.get('date') or (start.get('dateTime') or '')[:10]
+            if day:
+                self._content_index_cache.pop((calendar_id, day), None)
+    
+    async def _get_calendar_metadata(self, calendar_id: str) -> Dict[str, Any]:
+        """Return calendars.get metadata, cached for CALENDAR_CACHE_TTL_SECONDS.
+        
+        An expired entry is revalidated with its etag, so unchanged metadata
+        costs a bodiless 304 rather than a full response.
+        
+        Raises:
+            HttpError: If the API call fails; 403/404 also evict the cache entry,
+                and a 404 is remembered for the same TTL
+        """
+        now = time.monotonic()
+        cached = self._calendar_meta_cache.get(calendar_id)
+        if cached and now - cached[0] < CALENDAR_CACHE_TTL_SECONDS:
+            return cached[1]
+        missing = self._missing_calendar_cache.get(calendar_id)
+        if missing and now - missing[0] < CALENDAR_CACHE_TTL_SECONDS:
+            # Known-missing calendar: re-raise without another round trip
+            raise missing[1].with_traceback(None)
+        
+        request = self.service.calendars().get(calendarId=calendar_id)
+        if cached and cached[1].get('etag'):
+            request.headers['If-None-Match'] = cached[1]['etag']
+        try:
+            calendar_data = await self._execute(request)
+        except HttpError as e:
+            if e.resp.status == 304 and cached:
+                calendar_data = cached[1]
+                self._calendar_meta_cache[calendar_id] = (time.monotonic(), calendar_data)
+                return calendar_data
+            if e.resp.status in (403, 404):
+                self._calendar_meta_cache.pop(calendar_id, None)
+            if e.resp.status == 404:
+                self._missing_calendar_cache[calendar_id] = (time.monotonic(), e)
+            raise
+        
+        self._calendar_meta_cache[calendar_id] = (time.monotonic(), calendar_data)
+        return calendar_data
+    
     async def get_primary_calendar(self) -> CalendarInfo:
         """Get primary Google calendar."""
         calendars = await self.get_calendars()
@@ -211,89 +794,28 @@ class GoogleCalendarService(BaseCalendarService):
         """Get events from Google calendar asynchronously with sync token support."""
         self._ensure_authenticated()
         
+        # With a result cap the first page may be the last one needed
+        pages = self._iter_event_pages(
+            calendar_id, time_min, time_max, max_results, updated_min, sync_token,
+            prefetch=not max_results
+        )
         try:
-            page_token = None
             events_yielded = 0
-            next_sync_token = None
-            
-            while True:
-                # Build request parameters
-                params = {
-                    'calendarId': calendar_id,
-                    'maxResults': min(250, max_results or 250)
-                }
-                
-                # CRITICAL: Use sync token for true incremental sync when available
-                if sync_token:
-                    # Sync token mode - gets ALL changes since last sync (including deletes)
-                    params['syncToken'] = sync_token
-                    # IMPORTANT: Do NOT use time filters with sync tokens
-                    # Sync tokens return all events that changed, regardless of time
-                else:
-                    # Time window mode - ONLY for initial sync
-                    # WARNING: This mode cannot detect deletions reliably
-                    if time_min is None:
-                        time_min = datetime.now(pytz.UTC) - timedelta(
-                            days=self.settings.sync_config.sync_past_days
-                        )
-                    if time_max is None:
-                        time_max = datetime.now(pytz.UTC) + timedelta(
-                            days=self.settings.sync_config.sync_future_days
-                        )
-                    
-                    params.update({
-                        'timeMin': time_min.isoformat(),
-                        'timeMax': time_max.isoformat(),
-                        'singleEvents': True,
-                        'orderBy': 'startTime'
-                    })
-                    
-                    # NOTE: updatedMin is redundant with sync tokens but useful for time windows
-                    if updated_min:
-                        params['updatedMin'] = updated_min.isoformat()
+            async for events_result in pages:
+                # Skip cancelled events here; deletions are handled in get_change_set
+                live_items = [
+                    item for item in events_result.get('items', [])
+                    if item.get('status') != 'cancelled'
+                ]
+                if max_results:
+                    live_items = live_items[:max_results - events_yielded]
                 
-                if page_token:
-                    params['pageToken'] = page_token
+                for event in await self._format_google_events(live_items):
+                    yield event
+                    events_yielded += 1
                 
-                # Execute API call with rate limit handling
-                try:
-                    events_result = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.service.events().list(**params).execute()
-                    )
-                except HttpError as e:
-                    if e.resp.status == 429:  # Rate limited
-                        self.logger.warning("Google API rate limited, retrying...")
-                        raise CalendarServiceError(f"Rate limited: {e}")
-                    raise
-                
-                # Process events
-                for event_data in events_result.get('items', []):
-                    # Skip cancelled events here; deletions are handled in get_change_set
-                    if event_data.get('status') == 'cancelled':
-                        continue
-                    if max_results and events_yielded >= max_results:
-                        return
-                    
-                    try:
-                        event = self._format_google_event(event_data)
-                        yield event
-                        events_yielded += 1
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Failed to format Google event {event_data.get('id')}: {e}"
-                        )
-                        continue
-                
-                # Check for next page or sync token
-                page_token = events_result.get('nextPageToken')
-                next_sync_token = events_result.get('nextSyncToken')
-                
-                if not page_token:
-                    # Store the sync token for future incremental syncs
-                    if next_sync_token and hasattr(self, '_current_sync_token_callback'):
-                        self._current_sync_token_callback(next_sync_token)
-                    break
+                if max_results and events_yielded >= max_results:
+                    return
                 
         except HttpError as e:
             if e.resp.status == 404:
@@ -301,10 +823,100 @@ class GoogleCalendarService(BaseCalendarService):
             raise CalendarServiceError(f"Failed to get Google events: {e}")
         except Exception as e:
             raise CalendarServiceError(f"Failed to get Google events: {e}")
+        finally:
+            await pages.aclose()
 
     class TokenInvalid(Exception):
         pass
 
+    async def _iter_event_pages(
+        self,
+        calendar_id: str,
+        time_min: Optional[datetime],
+        time_max: Optional[datetime],
+        max_results: Optional[int],
+        updated_min: Optional[datetime],
+        sync_token: Optional[str],
+        prefetch: bool = True,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield raw events.list pages, fetching each next page ahead of time.
+        
+        Shared by get_events and get_change_set. With a sync token, deleted
+        events are included (as cancelled items) and a 410 raises TokenInvalid;
+        otherwise the configured sync window bounds the listing. Callers that
+        may stop early pass prefetch=False so no page is requested unread.
+        """
+        # The time window is fixed for the whole pagination run, so resolve it once
+        if not sync_token and (time_min is None or time_max is None):
+            cfg = self.settings.sync_config
+            now = datetime.now(timezone.utc)
+            if time_min is None:
+                time_min = now - timedelta(days=cfg.sync_past_days)
+            if time_max is None:
+                time_max = now + timedelta(days=cfg.sync_future_days)
+
+        # Everything but the page token is the same for every page
+        base_params: Dict[str, Any] = {
+            'calendarId': calendar_id,
+            'maxResults': min(EVENTS_PAGE_SIZE, max_results or EVENTS_PAGE_SIZE),
+            'fields': EVENT_LIST_FIELDS
+        }
+        if sync_token:
+            # Sync tokens return every change regardless of time, so no time filters
+            base_params.update({
+                'syncToken': sync_token,
+                'showDeleted': True,
+                'singleEvents': True
+            })
+        else:
+            base_params.update({
+                'timeMin': time_min.isoformat(),
+                'timeMax': time_max.isoformat(),
+                'singleEvents': True,
+                'orderBy': 'startTime'
+            })
+            if updated_min:
+                base_params['updatedMin'] = updated_min.isoformat()
+
+        async def _fetch_page(token: Optional[str]) -> Dict[str, Any]:
+            params = base_params
+            if token:
+                params = {**base_params, 'pageToken': token}
+            try:
+                return await self._execute(self.service.events().list(**params))
+            except HttpError as e:
+                if e.resp.status == 429:
+                    self.logger.warning("Google API rate limited, retrying...")
+                    raise CalendarServiceError(f"Rate limited: {e}")
+                if e.resp.status == 410 and sync_token:
+                    self.logger.warning("Google sync token expired/invalid (410)")
+                    raise GoogleCalendarService.TokenInvalid()
+                raise
+
+        # The next page is requested before the current one is consumed, so
+        # formatting overlaps the network wait instead of following it
+        next_page: Optional['asyncio.Task[Dict[str, Any]]'] = None
+        next_sync_token: Optional[str] = None
+        try:
+            next_page = asyncio.ensure_future(_fetch_page(None))
+            while next_page is not None:
+                events_result = await next_page
+                page_token = events_result.get('nextPageToken')
+                next_page = None
+                if page_token and prefetch:
+                    next_page = asyncio.ensure_future(_fetch_page(page_token))
+                next_sync_token = events_result.get('nextSyncToken') or next_sync_token
+                yield events_result
+                if page_token and next_page is None:
+                    next_page = asyncio.ensure_future(_fetch_page(page_token))
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+        # Store the sync token for future incremental syncs
+        if next_sync_token and hasattr(self, '_current_sync_token_callback'):
+            self._current_sync_token_callback(next_sync_token)
+
     async def get_change_set(
         self,
         calendar_id: str,
@@ -323,82 +935,29 @@ class GoogleCalendarService(BaseCalendarService):
         changed: Dict[str, CalendarEvent] = {}
         deleted_ids: set[str] = set()
         next_sync_token: Optional[str] = None
-        page_token: Optional[str] = None
-
-        def _build_params() -> Dict[str, Any]:
-            params: Dict[str, Any] = {
-                'calendarId': calendar_id,
-                'maxResults': min(250, max_results or 250)
-            }
-            if sync_token:
-                params['syncToken'] = sync_token
-            else:
-                nonlocal time_min, time_max
-                if time_min is None:
-                    time_min = datetime.now(pytz.UTC) - timedelta(days=self.settings.sync_config.sync_past_days)
-                if time_max is None:
-                    time_max = datetime.now(pytz.UTC) + timedelta(days=self.settings.sync_config.sync_future_days)
-                params.update({
-                    'timeMin': time_min.isoformat(),
-                    'timeMax': time_max.isoformat(),
-                    'singleEvents': True,
-                    'orderBy': 'startTime'
-                })
-                if updated_min:
-                    params['updatedMin'] = updated_min.isoformat()
-            if page_token:
-                params['pageToken'] = page_token
-            return params
 
-        used_sync = bool(sync_token)
+        pages = self._iter_event_pages(
+            calendar_id, time_min, time_max, max_results, updated_min, sync_token
+        )
         try:
-            while True:
-                params = _build_params()
-                if sync_token:
-                    params['showDeleted'] = True
-                    params['singleEvents'] = True
-                    params['maxResults'] = min(2500, max_results or 2500)
-                try:
-                    events_result = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.service.events().list(**params).execute()
-                    )
-                except HttpError as e:
-                    if e.resp.status == 429:
-                        self.logger.warning("Google API rate limited, retrying...")
-                        raise CalendarServiceError(f"Rate limited: {e}")
-                    if e.resp.status == 410 and sync_token:
-                        self.logger.warning("Google sync token expired/invalid (410)")
-                        raise GoogleCalendarService.TokenInvalid()
-                    raise
-
+            async for events_result in pages:
+                live_items = []
                 for event_data in events_result.get('items', []):
-                    status = event_data.get('status')
-                    event_id = event_data.get('id')
-                    if status == 'cancelled':
+                    if event_data.get('status') == 'cancelled':
+                        event_id = event_data.get('id')
                         if event_id:
                             deleted_ids.add(event_id)
-                        continue
-                    try:
-                        ev = self._format_google_event(event_data)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to format Google event {event_id}: {e}")
-                        continue
-                    changed[ev.id] = ev
+                    else:
+                        live_items.append(event_data)
 
-                page_token = events_result.get('nextPageToken')
+                changed.update({ev.id: ev for ev in await self._format_google_events(live_items)})
                 next_sync_token = events_result.get('nextSyncToken') or next_sync_token
-                if not page_token:
-                    break
-
-            if next_sync_token and hasattr(self, '_current_sync_token_callback'):
-                self._current_sync_token_callback(next_sync_token)
 
             return ChangeSet[CalendarEvent](
                 changed=changed,
                 deleted_native_ids=deleted_ids,
                 next_sync_token=next_sync_token,
-                used_sync_token=used_sync,
+                used_sync_token=bool(sync_token),
             )
         except HttpError as e:
             if e.resp.status == 404:
@@ -408,6 +967,37 @@ class GoogleCalendarService(BaseCalendarService):
             raise
         except Exception as e:
             raise CalendarServiceError(f"Failed to get Google change set: {e}")
+        finally:
+            await pages.aclose()
+    
+    async def get_change_sets(
+        self,
+        calendar_ids: List[str],
+        sync_tokens: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Dict[str, ChangeSet[CalendarEvent]]:
+        """Fetch change sets for several calendars concurrently.
+        
+        Args:
+            calendar_ids: Google calendar IDs to fetch
+            sync_tokens: Optional mapping of calendar ID to its stored sync token
+            
+        Returns:
+            Mapping of calendar ID to its change set
+        """
+        sync_tokens = sync_tokens or {}
+        # Keep in-flight list requests within the HTTP connection pool size
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests)
+        
+        async def _fetch_one(calendar_id: str) -> Tuple[str, ChangeSet[CalendarEvent]]:
+            async with semaphore:
+                change_set = await self.get_change_set(
+                    calendar_id,
+                    sync_token=sync_tokens.get(calendar_id)
+                )
+                return calendar_id, change_set
+        
+        results = await asyncio.gather(*(_fetch_one(cid) for cid in calendar_ids))
+        return dict(results)
     
     async def get_changes(
         self,
@@ -429,12 +1019,11 @@ class GoogleCalendarService(BaseCalendarService):
         self._ensure_authenticated()
         
         try:
-            event_data = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().get(
+            event_data = await self._execute(
+                self.service.events().get(
                     calendarId=calendar_id,
                     eventId=event_id
-                ).execute()
+                )
             )
             return self._format_google_event(event_data)
             
@@ -453,24 +1042,34 @@ class GoogleCalendarService(BaseCalendarService):
         """Create a new Google Calendar event, or update if it already exists."""
         self._ensure_authenticated()
         
-        self.logger.info(f"🔍 Creating Google Calendar event: {event_data.summary}")
-        self.logger.info(f"   → Original calendar ID: {calendar_id}")
-        self.logger.info(f"   → Event UID: {event_data.uid}")
-        self.logger.info(f"   → Event source: {event_data.source}")
-        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Creating Google Calendar event: {event_data.summary} "
+                f"(calendar={calendar_id}, uid={event_data.uid}, source={event_data.source})"
+            )
         
         # Validate calendar ID first
         validated_calendar_id = await self._validate_calendar_id(calendar_id)
         
-        
-        # With deterministic ID generation, we should rarely get duplicates
-        # But keep a simple check for safety
-        if event_data.uid:
-            self.logger.debug(f"Creating event with UID: {event_data.uid}")
-        
         # Proceed with creation using the validated ID
         return await self._create_event_with_retry(validated_calendar_id, event_data)
     
+    async def create_event_batched(
+        self,
+        calendar_id: str,
+        event_data: CalendarEvent
+    ) -> CalendarEvent:
+        """Create a Google Calendar event, sending the insert through the batch queue.
+        
+        Concurrent callers share multipart batch requests; duplicate and
+        invalid-ID recovery still uses individual requests.
+        """
+        self._ensure_authenticated()
+        validated_calendar_id = await self._validate_calendar_id(calendar_id)
+        return await self._create_event_with_retry(
+            validated_calendar_id, event_data, execute=self._execute_batched
+        )
+    
     # @retry(
     #     stop=stop_after_attempt(3),
     #     wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -479,9 +1078,14 @@ class GoogleCalendarService(BaseCalendarService):
     async def _create_event_with_retry(
         self,
         validated_calendar_id: str,
-        event_data: CalendarEvent
+        event_data: CalendarEvent,
+        execute: Optional[Callable[[HttpRequest], Awaitable[Any]]] = None
     ) -> CalendarEvent:
-        """Create event with retry logic using validated calendar ID."""
+        """Create event with retry logic using validated calendar ID.
+        
+        execute sends the insert request and defaults to _execute.
+        """
+        execute = execute or self._execute
         try:
             # Convert event data WITH event ID generation to prevent duplicates
             # This follows Google's best practice: "generate your own unique event ID"
@@ -490,8 +1094,8 @@ class GoogleCalendarService(BaseCalendarService):
                 'summary': event_data.summary or 'Untitled Event',
                 'description': event_data.description or '',
                 'location': event_data.location or '',
-                'start': {'date': event_data.start.strftime('%Y-%m-%d')} if event_data.all_day else {'dateTime': event_data.start.isoformat()},
-                'end': {'date': event_data.end.strftime('%Y-%m-%d')} if event_data.all_day else {'dateTime': event_data.end.isoformat()}
+                'start': self._format_datetime_for_google(event_data.start, event_data.all_day),
+                'end': self._format_datetime_for_google(event_data.end, event_data.all_day)
             }
             
             # Add iCalUID for cross-platform matching (this was working fine)
@@ -505,12 +1109,11 @@ class GoogleCalendarService(BaseCalendarService):
             if event_id:
                 # Check if event already exists with this ID
                 try:
-                    existing = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.service.events().get(
+                    existing = await self._execute(
+                        self.service.events().get(
                             calendarId=validated_calendar_id,
                             eventId=event_id
-                        ).execute()
+                        )
                     )
                     # Update instead of create
                     return await self.update_event(validated_calendar_id, event_id, event_data)
@@ -519,30 +1122,38 @@ class GoogleCalendarService(BaseCalendarService):
                     pass
             
             # Insert with deterministic ID
-            created_event = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().insert(
+            created_event = await execute(
+                self.service.events().insert(
                     calendarId=validated_calendar_id,
                     body=google_event_data
-                ).execute()
+                )
+            )
+            # The new event belongs in that day's content index
+            self._content_index_cache.pop(
+                (validated_calendar_id, _format_date(event_data.start)), None
             )
             
             return self._format_google_event(created_event)
             
         except HttpError as e:
+            if e.resp.status == 404:
+                # The calendar vanished since validation; resolve it afresh next time
+                for requested_id, resolved_id in list(self._validated_calendars.items()):
+                    if resolved_id == validated_calendar_id:
+                        del self._validated_calendars[requested_id]
+                self._calendar_meta_cache.pop(validated_calendar_id, None)
             if e.resp.status == 400 and "Invalid resource id value" in str(e):
                 # This is likely a duplicate ID - try to find and update existing event
-                self.logger.warning(f"🔄 Invalid resource id value - likely duplicate ID, attempting to find existing event")
+                self.logger.warning("🔄 Invalid resource id value - likely duplicate ID, attempting to find existing event")
                 if event_data.uid:
                     try:
                         # Try to find existing event with same deterministic ID
                         deterministic_id = self._generate_compliant_event_id(event_data.uid) 
-                        existing = await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: self.service.events().get(
+                        existing = await self._execute(
+                            self.service.events().get(
                                 calendarId=validated_calendar_id,
                                 eventId=deterministic_id
-                            ).execute()
+                            )
                         )
                         self.logger.info(f"📝 Found existing event with same ID, updating instead")
                         return await self.update_event(validated_calendar_id, deterministic_id, event_data)
@@ -554,7 +1165,7 @@ class GoogleCalendarService(BaseCalendarService):
                                 self.logger.info(f"📝 Found existing event via UID search, updating instead")
                                 return await self.update_event(validated_calendar_id, existing_events[0]['id'], event_data)
                         except Exception as search_error:
-                            self.logger.error(f"UID search also failed: {search_error}")
+                            self.logger.error("UID search also failed: %s", search_error)
             
             elif e.resp.status == 409 and "duplicate" in str(e).lower():
                 # 409 Duplicate - try to find and return the existing event
@@ -570,12 +1181,11 @@ class GoogleCalendarService(BaseCalendarService):
                         # Try deterministic ID lookup
                         deterministic_id = self._generate_compliant_event_id(event_data.uid)
                         try:
-                            existing = await asyncio.get_event_loop().run_in_executor(
-                                None,
-                                lambda: self.service.events().get(
+                            existing = await self._execute(
+                                self.service.events().get(
                                     calendarId=validated_calendar_id,
                                     eventId=deterministic_id
-                                ).execute()
+                                )
                             )
                             self.logger.debug(f"✅ Found existing event by deterministic ID, returning it")
                             return self._format_google_event(existing)
@@ -595,167 +1205,166 @@ class GoogleCalendarService(BaseCalendarService):
                     self.logger.debug(f"Content search failed: {content_error}")
                 
                 # If all fails, log and skip instead of raising error
-                self.logger.warning(f"⚠️ 409 duplicate but couldn't find existing event for '{event_data.summary}', skipping")
+                self.logger.warning("⚠️ 409 duplicate but couldn't find existing event for '%s', skipping", event_data.summary)
                 return None
             
-            self.logger.error(f"❌ Create event failed with validated_calendar_id={validated_calendar_id}, error: {e}")
+            self.logger.error("❌ Create event failed with validated_calendar_id=%s, error: %s", validated_calendar_id, e)
             raise CalendarServiceError(f"Failed to create Google event: {e}")
         except Exception as e:
-            self.logger.error(f"❌ Create event failed with validated_calendar_id={validated_calendar_id}, error: {e}")
+            self.logger.error("❌ Create event failed with validated_calendar_id=%s, error: %s", validated_calendar_id, e)
             raise CalendarServiceError(f"Failed to create Google event: {e}")
     
     async def _find_events_by_uid(self, calendar_id: str, uid: str) -> List[Dict[str, Any]]:
         """Find events in Google Calendar by iCalUID."""
         try:
-            # Google Calendar API doesn't reliably support iCalUID parameter in list()
-            # Instead, we need to search through events and filter manually
-            # Get recent events and search through them
-            events_result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().list(
+            # events.list filters on iCalUID server-side, so the response is
+            # usually a single event instead of a page we have to scan
+            events_result = await self._execute(
+                self.service.events().list(
                     calendarId=calendar_id,
-                    maxResults=250,  # Increased to catch more events
-                    singleEvents=True,
-                    orderBy='updated'
-                ).execute()
+                    iCalUID=uid,
+                    showDeleted=False,
+                    maxResults=10
+                )
             )
             
-            events = events_result.get('items', [])
-            
-            # Filter events by iCalUID
-            matching_events = []
-            self.logger.debug(f"Searching through {len(events)} events for UID: {uid}")
-            
-            for event in events:
-                event_uid = event.get('iCalUID')
-                if event_uid == uid:
-                    matching_events.append(event)
-                    self.logger.debug(f"✅ Found matching event: {event.get('id')} with UID {event_uid}")
-            
-            self.logger.info(f"🔍 Search complete: Found {len(matching_events)} events with UID {uid} out of {len(events)} total events")
+            matching_events = events_result.get('items', [])
+            self.logger.debug(f"🔍 Search complete: Found {len(matching_events)} events with UID {uid}")
             return matching_events
             
         except HttpError as e:
             if e.resp.status == 404:
                 return []  # Calendar not found, no events
-            self.logger.warning(f"Failed to search for events by UID: {e}")
+            if e.resp.status == 400:
+                # Server rejected the iCalUID filter - fall back to scanning
+                self.logger.debug(f"iCalUID query rejected, falling back to thorough search: {e}")
+                return await self._find_events_by_uid_thorough(calendar_id, uid)
+            self.logger.warning("Failed to search for events by UID: %s", e)
             return []  # Return empty instead of raising
         except Exception as e:
-            self.logger.warning(f"Failed to search for events by UID: {e}")
+            self.logger.warning("Failed to search for events by UID: %s", e)
             return []  # Return empty instead of raising
 
     async def _find_events_by_uid_thorough(self, calendar_id: str, uid: str) -> List[Dict[str, Any]]:
-        """More thorough search for events by iCalUID - searches more events and time ranges."""
+        """More thorough search for events by iCalUID - searches more events and time ranges.
+
+        Only used as a fallback when the server-side iCalUID filter is rejected.
+        """
         try:
-            all_events = []
-            
-            # Search recent events
-            recent_result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().list(
-                    calendarId=calendar_id,
-                    maxResults=500,  # Increased even more
-                    singleEvents=True,
-                    orderBy='updated'
-                ).execute()
-            )
-            all_events.extend(recent_result.get('items', []))
-            
-            # Also search upcoming events
-            from datetime import datetime, timedelta
-            import pytz
-            
-            time_min = (datetime.now(pytz.UTC) - timedelta(days=90)).isoformat()
-            time_max = (datetime.now(pytz.UTC) + timedelta(days=90)).isoformat()
-            
-            range_result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().list(
-                    calendarId=calendar_id,
-                    maxResults=500,
-                    singleEvents=True,
-                    orderBy='startTime',
-                    timeMin=time_min,
-                    timeMax=time_max
-                ).execute()
-            )
-            all_events.extend(range_result.get('items', []))
-            
-            # Remove duplicates based on event ID
-            seen_ids = set()
-            unique_events = []
-            for event in all_events:
-                if event.get('id') not in seen_ids:
-                    unique_events.append(event)
-                    seen_ids.add(event.get('id'))
-            
-            # Filter by iCalUID
+            now = datetime.now(timezone.utc)
+            # Cheapest first: a free-text search often hits UIDs embedded in
+            # descriptions; otherwise scan recently updated, then nearby events
+            searches = [
+                {'q': uid[:128], 'maxResults': 250, 'singleEvents': True},
+                {'maxResults': 500, 'singleEvents': True, 'orderBy': 'updated'},
+                {
+                    'maxResults': 500,
+                    'singleEvents': True,
+                    'orderBy': 'startTime',
+                    'timeMin': (now - timedelta(days=90)).isoformat(),
+                    'timeMax': (now + timedelta(days=90)).isoformat()
+                },
+            ]
+            
+            # Filter as pages arrive and stop at the first search that matches;
+            # callers only need one event carrying the UID
+            seen_ids: Set[str] = set()
             matching_events = []
-            self.logger.info(f"🔍 Thorough search: Checking {len(unique_events)} unique events for UID: {uid}")
-            
-            for event in unique_events:
-                event_uid = event.get('iCalUID')
-                if event_uid == uid:
-                    matching_events.append(event)
-                    self.logger.info(f"✅ Found matching event in thorough search: {event.get('id')} with UID {event_uid}")
+            for params in searches:
+                result = await self._execute(
+                    self.service.events().list(calendarId=calendar_id, **params)
+                )
+                for event in result.get('items', []):
+                    event_id = event.get('id')
+                    if not event_id or event_id in seen_ids:
+                        continue
+                    seen_ids.add(event_id)
+                    if event.get('iCalUID') == uid:
+                        matching_events.append(event)
+                if matching_events:
+                    break
             
-            self.logger.info(f"🔍 Thorough search complete: Found {len(matching_events)} events with UID {uid}")
+            self.logger.info(
+                f"🔍 Thorough search complete: Found {len(matching_events)} events with UID {uid} "
+                f"among {len(seen_ids)} unique events"
+            )
             return matching_events
             
         except Exception as e:
-            self.logger.warning(f"Failed to perform thorough search for events by UID: {e}")
+            self.logger.warning("Failed to perform thorough search for events by UID: %s", e)
             return []
 
+    @staticmethod
+    def _content_key(summary: Optional[str], start_date: str, all_day: bool) -> Tuple[str, str, bool]:
+        """Build the (summary, start date, all-day) key used by the content index."""
+        text = summary.strip() if summary else ''
+        # Most summaries are already normalized; skip allocating a lowered copy
+        if text and not text.islower():
+            text = text.lower()
+        return (text, start_date, all_day)
+    
+    async def _load_window_index(
+        self,
+        calendar_id: str,
+        day: datetime,
+        refresh: bool = False
+    ) -> Dict[Tuple[str, str, bool], List[Dict[str, Any]]]:
+        """Index events around a day by (summary, start date, all-day).
+        
+        The index covers the day plus one day either side, which is a superset
+        of the ±1 day window searched around any start time on that day. It
+        is cached per (calendar, day) for the lifetime of the service.
+        """
+        cache_key = (calendar_id, _format_date(day))
+        if not refresh and cache_key in self._content_index_cache:
+            return self._content_index_cache[cache_key]
+        
+        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        events_result = await self._execute(
+            self.service.events().list(
+                calendarId=calendar_id,
+                timeMin=(day_start - timedelta(days=1)).isoformat(),
+                timeMax=(day_start + timedelta(days=2)).isoformat(),
+                singleEvents=True,
+                orderBy='startTime',
+                maxResults=250
+            )
+        )
+        
+        index: Dict[Tuple[str, str, bool], List[Dict[str, Any]]] = {}
+        for event in events_result.get('items', []):
+            start = event.get('start', {})
+            if start.get('date'):
+                key = self._content_key(event.get('summary'), start['date'], True)
+            elif start.get('dateTime'):
+                key = self._content_key(event.get('summary'), start['dateTime'][:10], False)
+            else:
+                continue
+            index.setdefault(key, []).append(event)
+        
+        self._content_index_cache[cache_key] = index
+        return index
+    
     async def _find_events_by_content(self, calendar_id: str, event_data: CalendarEvent) -> List[Dict[str, Any]]:
         """Find events by matching content (summary, start time) when UID search fails."""
         try:
-            # Search around the event's time (±1 day) for efficiency
-            from datetime import timedelta
-            import pytz
-            
-            start_time = event_data.start
-            search_start = (start_time - timedelta(days=1)).isoformat()
-            search_end = (start_time + timedelta(days=1)).isoformat()
-            
-            events_result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().list(
-                    calendarId=calendar_id,
-                    timeMin=search_start,
-                    timeMax=search_end,
-                    singleEvents=True,
-                    orderBy='startTime',
-                    maxResults=100
-                ).execute()
+            key = self._content_key(
+                event_data.summary, _format_date(event_data.start), event_data.all_day
             )
+            cached = (calendar_id, key[1]) in self._content_index_cache
+            index = await self._load_window_index(calendar_id, event_data.start)
+            matching_events = index.get(key, [])
             
-            events = events_result.get('items', [])
-            matching_events = []
-            
-            self.logger.debug(f"🔍 Content search: Found {len(events)} events in time range")
-            
-            for event in events:
-                # Match by summary and start time (allowing small time differences)
-                if (event.get('summary', '').strip().lower() == event_data.summary.strip().lower()):
-                    
-                    # Check start time match
-                    event_start_str = None
-                    if event_data.all_day:
-                        event_start_str = event.get('start', {}).get('date')
-                        expected_start = event_data.start.strftime('%Y-%m-%d')
-                    else:
-                        event_start_str = event.get('start', {}).get('dateTime', '').split('T')[0] if event.get('start', {}).get('dateTime') else None
-                        expected_start = event_data.start.strftime('%Y-%m-%d')
-                    
-                    if event_start_str and event_start_str.startswith(expected_start):
-                        matching_events.append(event)
-                        self.logger.info(f"✅ Content match found: Event ID {event.get('id')} with summary '{event.get('summary')}' at {event_start_str}")
+            if not matching_events and cached:
+                # The cached window may predate the event we collided with
+                index = await self._load_window_index(calendar_id, event_data.start, refresh=True)
+                matching_events = index.get(key, [])
             
             self.logger.info(f"🔍 Content search complete: Found {len(matching_events)} content matches")
-            return matching_events
+            return list(matching_events)
             
         except Exception as e:
-            self.logger.warning(f"Failed to perform content-based search: {e}")
+            self.logger.warning("Failed to perform content-based search: %s", e)
             return []
 
     def _generate_compliant_event_id(self, uid: str) -> str:
@@ -769,48 +1378,7 @@ class GoogleCalendarService(BaseCalendarService):
         CRITICAL: Google Calendar strictly enforces base32hex format.
         Using characters outside [a-v0-9] causes "Invalid resource id value" errors.
         """
-        import hashlib
-        
-        # Create hash from UID
-        hash_bytes = hashlib.sha256(uid.encode()).digest()
-        
-        # STRICT RFC2938 base32hex alphabet - ONLY these characters are valid for Google Calendar
-        base32hex_alphabet = '0123456789abcdefghijklmnopqrstuv'
-        
-        # Manual base32hex encoding ensuring strict compliance
-        def base32hex_encode(data: bytes) -> str:
-            """Encode bytes using RFC2938 base32hex alphabet."""
-            bits = ''.join(format(byte, '08b') for byte in data)
-            # Pad to multiple of 5 bits
-            while len(bits) % 5 != 0:
-                bits += '0'
-            
-            result = ''
-            for i in range(0, len(bits), 5):
-                chunk = bits[i:i+5]
-                result += base32hex_alphabet[int(chunk, 2)]
-            
-            return result
-        
-        # Generate strictly compliant base32hex ID
-        event_id = base32hex_encode(hash_bytes)
-        
-        # Truncate to reasonable length (Google allows up to 1024)
-        if len(event_id) > 32:
-            event_id = event_id[:32]
-        
-        # Ensure minimum length (Google requires at least 5)
-        if len(event_id) < 5:
-            event_id = event_id + '0' * (5 - len(event_id))
-        
-        # Ensure starts with a letter to avoid potential backend issues
-        if event_id[0].isdigit():
-            # Replace first digit with corresponding letter (0->a, 1->b, etc.)
-            first_char = chr(ord('a') + int(event_id[0]))
-            event_id = first_char + event_id[1:]
-        
-        self.logger.debug(f"Generated base32hex event ID: {event_id} (length: {len(event_id)}) from UID: {uid[:20]}...")
-        return event_id
+        return _uid_to_event_id(uid, self.settings.google_event_id_hash)
 
     async def _validate_calendar_id(self, calendar_id: str) -> str:
         """Validate Google Calendar ID efficiently without creating test events.
@@ -828,33 +1396,40 @@ class GoogleCalendarService(BaseCalendarService):
         # Skip pre-validation - let Google Calendar API validate the ID
         # The long hex string might actually be a valid shared/group calendar ID
         
+        validated = self._validated_calendars.get(calendar_id)
+        if validated is not None:
+            return validated
+        
         try:
-            # Simple validation: try to get calendar metadata (lightweight operation)
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.calendars().get(calendarId=calendar_id).execute()
-            )
+            # Simple validation: try to get calendar metadata (lightweight, cached)
+            await self._get_calendar_metadata(calendar_id)
             
-            self.logger.debug(f"Calendar ID is valid: {calendar_id}")
+            self.logger.debug("Calendar ID is valid: %s", calendar_id)
+            self._validated_calendars[calendar_id] = calendar_id
             return calendar_id
             
         except HttpError as e:
             
             # Handle invalid calendar ID gracefully
             if e.resp.status == 400:
-                self.logger.warning(f"📋 Google Calendar ID format invalid: {calendar_id}")
+                self.logger.warning("📋 Google Calendar ID format invalid: %s", calendar_id)
             elif e.resp.status == 404:
-                self.logger.warning(f"📋 Google Calendar not found: {calendar_id}")
+                self.logger.warning("📋 Google Calendar not found: %s", calendar_id)
             elif e.resp.status == 403:
-                self.logger.warning(f"📋 Google Calendar access denied: {calendar_id}")
+                self.logger.warning("📋 Google Calendar access denied: %s", calendar_id)
             else:
-                self.logger.warning(f"📋 Google Calendar validation failed: {e}")
+                self.logger.warning("📋 Google Calendar validation failed: %s", e)
             
-            # Try to find a working alternative
-            return await self._find_fallback_calendar()
+            # Try to find a working alternative. Only a calendar that can't
+            # exist sticks to it instead of re-resolving (and re-warning) per
+            # event; after a denied or transient failure the next write retries
+            fallback_id = await self._find_fallback_calendar()
+            if e.resp.status in (400, 404):
+                self._validated_calendars[calendar_id] = fallback_id
+            return fallback_id
             
         except Exception as e:
-            self.logger.error(f"Unexpected error validating calendar ID {calendar_id}: {e}")
+            self.logger.error("Unexpected error validating calendar ID %s: %s", calendar_id, e)
             return await self._find_fallback_calendar()
     
     async def _find_fallback_calendar(self) -> str:
@@ -862,22 +1437,19 @@ class GoogleCalendarService(BaseCalendarService):
         try:
             self.logger.info("🔍 Searching for fallback Google Calendar...")
             
-            calendar_list = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.calendarList().list().execute()
-            )
+            calendar_items = await self._list_calendar_items()
             
             # Look for primary calendar first
-            for calendar_item in calendar_list.get('items', []):
+            for calendar_item in calendar_items:
                 if calendar_item.get('primary', False):
                     primary_id = calendar_item['id']
                     self.logger.info(f"✅ Using primary calendar as fallback: {primary_id}")
                     return primary_id
             
             # Look for any writable calendar
-            for calendar_item in calendar_list.get('items', []):
+            for calendar_item in calendar_items:
                 access_role = calendar_item.get('accessRole', '')
-                if access_role in ['owner', 'writer']:
+                if access_role in _WRITABLE_ROLES:
                     fallback_id = calendar_item['id']
                     calendar_name = calendar_item.get('summary', 'Unknown')
                     self.logger.info(f"✅ Using writable calendar as fallback: {calendar_name} ({fallback_id})")
@@ -888,7 +1460,7 @@ class GoogleCalendarService(BaseCalendarService):
             return 'primary'
             
         except Exception as list_error:
-            self.logger.error(f"Failed to list Google calendars for fallback: {list_error}")
+            self.logger.error("Failed to list Google calendars for fallback: %s", list_error)
             # Ultimate fallback
             return 'primary'
     
@@ -899,55 +1471,128 @@ class GoogleCalendarService(BaseCalendarService):
         event_data: CalendarEvent
     ) -> CalendarEvent:
         """Update a Google Calendar event."""
+        return await self._update_event(calendar_id, event_id, event_data, self._execute)
+    
+    async def update_event_batched(
+        self,
+        calendar_id: str,
+        event_id: str,
+        event_data: CalendarEvent
+    ) -> CalendarEvent:
+        """Update a Google Calendar event through the coalescing batch queue.
+        
+        Concurrent callers share multipart batch requests, so N updates cost
+        roughly ceil(N / BATCH_MAX_REQUESTS) round trips per phase.
+        """
+        return await self._update_event(calendar_id, event_id, event_data, self._execute_batched)
+    
+    async def _update_event(
+        self,
+        calendar_id: str,
+        event_id: str,
+        event_data: CalendarEvent,
+        execute: Callable[[HttpRequest], Awaitable[Any]],
+        google_event_data: Optional[Dict[str, Any]] = None
+    ) -> CalendarEvent:
+        """Update a Google Calendar event using the given request executor.
+        
+        google_event_data may carry event_data already converted with
+        _convert_to_google_format, as batch_update_events does up front.
+        """
         self._ensure_authenticated()
         
         try:
             # First, fetch the current event to get the latest sequence number
-            current_event = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().get(
+            current_event = await execute(
+                self.service.events().get(
                     calendarId=calendar_id,
                     eventId=event_id
-                ).execute()
+                )
             )
             
-            google_event_data = self._convert_to_google_format(event_data)
+            if google_event_data is None:
+                google_event_data = self._convert_to_google_format(event_data)
+            
+            # PATCH only what differs from the server copy. Fields we manage
+            # that are gone from the source are nulled, as a full update would
+            patch_body = {
+                key: value for key, value in google_event_data.items()
+                if key != 'sequence'
+                and not _event_field_unchanged(key, value, current_event.get(key))
+            }
+            for key in _CLEARABLE_EVENT_FIELDS:
+                if key in current_event and key not in google_event_data:
+                    patch_body[key] = None
+            # PATCH merges nested objects, so switching between all-day and
+            # timed must null the old form or Google keeps both and rejects it
+            for key in ('start', 'end'):
+                value = patch_body.get(key)
+                if value and 'date' in value:
+                    patch_body[key] = {'dateTime': None, 'timeZone': None, **value}
+                elif value and 'dateTime' in value:
+                    patch_body[key] = {'date': None, **value}
+            
+            if not patch_body:
+                return self._format_google_event(current_event)
             
             # Use the current sequence number from the existing event
             # This prevents "Invalid sequence value" errors
             if 'sequence' in current_event:
-                google_event_data['sequence'] = current_event['sequence']
+                patch_body['sequence'] = current_event['sequence']
             
-            updated_event = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().update(
-                    calendarId=calendar_id,
-                    eventId=event_id,
-                    body=google_event_data
-                ).execute()
+            patch_request = self.service.events().patch(
+                calendarId=calendar_id,
+                eventId=event_id,
+                body=patch_body
             )
+            if current_event.get('etag'):
+                # Conditional write: a concurrent change since our GET fails
+                # with 412 instead of being silently overwritten
+                patch_request.headers['If-Match'] = current_event['etag']
+            updated_event = await execute(patch_request)
+            # The event may have left one day's content index and joined another
+            self._forget_event_days(calendar_id, current_event, updated_event)
             
             return self._format_google_event(updated_event)
             
         except HttpError as e:
             if e.resp.status == 404:
                 raise EventNotFoundError(f"Google event {event_id} not found")
+            if e.resp.status == 412:
+                raise CalendarServiceError(
+                    f"Google event {event_id} changed during update, will retry next sync"
+                )
             raise CalendarServiceError(f"Failed to update Google event: {e}")
         except Exception as e:
             raise CalendarServiceError(f"Failed to update Google event: {e}")
     
     async def delete_event(self, calendar_id: str, event_id: str) -> None:
         """Delete a Google Calendar event."""
+        await self._delete_event(calendar_id, event_id, self._execute)
+    
+    async def delete_event_batched(self, calendar_id: str, event_id: str) -> None:
+        """Delete a Google Calendar event through the coalescing batch queue."""
+        await self._delete_event(calendar_id, event_id, self._execute_batched)
+    
+    async def _delete_event(
+        self,
+        calendar_id: str,
+        event_id: str,
+        execute: Callable[[HttpRequest], Awaitable[Any]]
+    ) -> None:
+        """Delete a Google Calendar event using the given request executor."""
         self._ensure_authenticated()
         
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().delete(
+            await execute(
+                self.service.events().delete(
                     calendarId=calendar_id,
                     eventId=event_id
-                ).execute()
+                )
             )
+            # The event's day isn't known here, so none of the calendar's
+            # content indexes may still list it
+            self.invalidate_content_index(calendar_id)
             
         except HttpError as e:
             if e.resp.status == 404:
@@ -966,29 +1611,35 @@ class GoogleCalendarService(BaseCalendarService):
         self._ensure_authenticated()
         try:
             # Use a tight window around the recurrence_id
-            from dateutil.parser import isoparse
             rid = isoparse(recurrence_id_iso)
             time_min = (rid - timedelta(minutes=5)).isoformat()
             time_max = (rid + timedelta(minutes=5)).isoformat()
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.events().instances(
+            result = await self._execute(
+                self.service.events().instances(
                     calendarId=calendar_id,
                     eventId=recurring_event_id,
                     timeMin=time_min,
                     timeMax=time_max,
-                    maxResults=50
-                ).execute()
+                    maxResults=50,
+                    fields='items(id,originalStartTime)'
+                )
             )
+            # Identical strings are the same instant; only parse on a mismatch
+            known_forms = {recurrence_id_iso, rid.isoformat()}
             for item in result.get('items', []):
-                # Match on originalStartTime if present
-                ost = item.get('originalStartTime', {}).get('dateTime') or item.get('originalStartTime', {}).get('date')
-                if ost:
-                    try:
-                        if isoparse(ost) == rid:
-                            return item.get('id')
-                    except Exception:
-                        continue
+                # Match on originalStartTime if present; Google returns RFC3339,
+                # so the fast parser suffices and each value is parsed once
+                ost = item.get('originalStartTime') or _EMPTY
+                value = ost.get('dateTime') or ost.get('date')
+                if not value:
+                    continue
+                if value in known_forms:
+                    return item.get('id')
+                try:
+                    if _parse_rfc3339(value) == rid:
+                        return item.get('id')
+                except ValueError:
+                    continue
             return None
         except HttpError as e:
             if e.resp.status == 404:
@@ -997,16 +1648,51 @@ class GoogleCalendarService(BaseCalendarService):
         except Exception as e:
             raise CalendarServiceError(f"Failed to query instances: {e}")
     
+    def _try_format_google_event(self, event_data: Dict[str, Any]) -> Optional[CalendarEvent]:
+        """Format a Google event, logging and returning None if it is malformed."""
+        try:
+            return self._format_google_event(event_data)
+        except Exception as e:
+            self.logger.warning("Failed to format Google event %s: %s", event_data.get('id'), e)
+            return None
+    
+    def _format_google_events_sync(self, items: List[Dict[str, Any]]) -> List[CalendarEvent]:
+        """Format a page of Google events, dropping any that fail to parse."""
+        events: List[CalendarEvent] = []
+        malformed: List[Tuple[Any, Exception]] = []
+        for event_data in items:
+            try:
+                events.append(self._format_google_event(event_data))
+            except Exception as e:
+                malformed.append((event_data.get('id'), e))
+        
+        # One warning per page rather than one per bad event
+        if malformed and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                "Failed to format %d Google event(s) %s: %s",
+                len(malformed), [event_id for event_id, _ in malformed], malformed[0][1]
+            )
+        return events
+    
+    async def _format_google_events(self, items: List[Dict[str, Any]]) -> List[CalendarEvent]:
+        """Format a page of Google events, offloading large pages from the event loop."""
+        if len(items) > FORMAT_OFFLOAD_THRESHOLD:
+            return await self._to_thread(self._format_google_events_sync, items)
+        return self._format_google_events_sync(items)
+    
     def _format_google_event(self, event_data: Dict[str, Any]) -> CalendarEvent:
         """Convert Google Calendar event to standard format."""
+        # Bound once; this runs for every event of every page
+        get = event_data.get
+        
         # Handle different date/time formats
-        start = event_data.get('start', {})
-        end = event_data.get('end', {})
+        start = get('start') or _EMPTY
+        end = get('end') or _EMPTY
         
         # Check if it's an all-day event
         all_day = 'date' in start
         
-        timezone = None
+        tz_name = None
         if all_day:
             # For all-day events, keep date format without timezone conversion
             start_dt = datetime.fromisoformat(start['date'])
@@ -1015,62 +1701,69 @@ class GoogleCalendarService(BaseCalendarService):
             # Extract timezone from dateTime
             start_tz_str = start.get('timeZone')
             if start_tz_str:
-                timezone = start_tz_str
+                tz_name = start_tz_str
             
-            start_dt = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00'))
+            start_dt = _parse_rfc3339(start['dateTime'])
+            end_dt = _parse_rfc3339(end['dateTime'])
         
-        # Parse attendees
-        attendees = []
-        for attendee in event_data.get('attendees', []):
-            attendees.append({
+        # Parse attendees; responseStatus is interned so the handful of
+        # distinct values are shared across every cached event
+        attendees = [
+            {
                 'email': attendee.get('email', ''),
                 'displayName': attendee.get('displayName', ''),
-                'responseStatus': attendee.get('responseStatus', 'needsAction'),
+                'responseStatus': sys.intern(attendee.get('responseStatus', 'needsAction')),
                 'organizer': attendee.get('organizer', False)
-            })
+            }
+            for attendee in get('attendees') or ()
+        ]
         
         # Extract recurrence information
         recurrence_rule = None
         recurrence_overrides = []
-        if 'recurrence' in event_data and event_data['recurrence']:
-            recurrence_rule = event_data['recurrence'][0]  # First RRULE
+        recurrence = get('recurrence')
+        if recurrence:
+            recurrence_rule = recurrence[0]  # First RRULE
         
         # CRITICAL: Handle Google's RECURRENCE-ID overrides
-        if 'recurringEventId' in event_data and event_data['recurringEventId']:
+        recurring_event_id = get('recurringEventId')
+        if recurring_event_id:
             # This is a recurrence override event in Google Calendar
+            start_iso = start_dt.isoformat()
             recurrence_overrides.append({
                 'type': 'recurrence-id',
-                'recurrence_id': start_dt.isoformat(),  # Use start time as recurrence ID
+                'recurrence_id': start_iso,  # Use start time as recurrence ID
                 'is_override': True,
-                'master_event_id': event_data['recurringEventId'],
-                'original_start': event_data.get('originalStartTime', {}).get('dateTime', start_dt.isoformat())
+                'master_event_id': recurring_event_id,
+                'original_start': (get('originalStartTime') or _EMPTY).get('dateTime') or start_iso
             })
         
         # Generate or use UID - Google events use iCalUID for deduplication
-        uid = event_data.get('iCalUID', f"google-{event_data['id']}")
+        uid = get('iCalUID')
+        if uid is None:
+            uid = f"google-{event_data['id']}"
         
         return CalendarEvent(
             id=event_data['id'],
             uid=uid,
             source=EventSource.GOOGLE,
-            summary=event_data.get('summary', ''),
-            description=event_data.get('description', ''),
-            location=event_data.get('location', ''),
+            summary=get('summary', ''),
+            description=get('description', ''),
+            location=get('location', ''),
             start=start_dt,
             end=end_dt,
             all_day=all_day,
-            timezone=timezone,
-            created=datetime.fromisoformat(event_data['created'].replace('Z', '+00:00')),
-            updated=datetime.fromisoformat(event_data['updated'].replace('Z', '+00:00')),
-            etag=event_data.get('etag'),
-            sequence=event_data.get('sequence', 0),
-            recurring_event_id=event_data.get('recurringEventId'),
+            timezone=tz_name,
+            created=_parse_rfc3339(event_data['created']),
+            updated=_parse_rfc3339(event_data['updated']),
+            etag=get('etag'),
+            sequence=get('sequence', 0),
+            recurring_event_id=recurring_event_id,
             recurrence_rule=recurrence_rule,
             recurrence_overrides=recurrence_overrides,
-            organizer=event_data.get('organizer'),
+            organizer=get('organizer'),
             attendees=attendees,
-            original_data=event_data
+            original_data={key: event_data[key] for key in _ORIGINAL_DATA_FIELDS if key in event_data}
         )
     
     def _convert_to_google_format(self, event: CalendarEvent, use_event_id: bool = False) -> Dict[str, Any]:
@@ -1102,45 +1795,30 @@ class GoogleCalendarService(BaseCalendarService):
             event_id = self._generate_compliant_event_id(event.uid)
             google_event['id'] = event_id
             
-            
-            self.logger.info(f"✅ Generated compliant event ID: '{event_id}' (length: {len(event_id)})")
-            self.logger.info(f"   → Original UID: {event.uid}")
-            self.logger.info(f"   → ID is base32hex compliant: {set(event_id).issubset(set('0123456789abcdefghijklmnopqrstuv'))}")
+            if not _GOOGLE_EVENT_ID_RE.match(event_id):
+                invalid = sorted({c for c in event_id if c not in _BASE32HEX_CHARS})
+                self.logger.warning("Generated event ID '%s' is not base32hex compliant: %s", event_id, invalid)
+            elif self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Generated compliant event ID '{event_id}' from UID {event.uid}")
             
         elif use_event_id:
-            self.logger.warning(f"⚠️  Cannot generate event ID - missing UID for event: {event.summary}")
+            self.logger.warning("⚠️  Cannot generate event ID - missing UID for event: %s", event.summary)
         
         # Set iCalUID for cross-platform matching (RFC5545 allows hyphens)
         if event.uid:
             clean_uid = str(event.uid).strip()
             if clean_uid:
                 google_event['iCalUID'] = clean_uid
-                self.logger.debug(f"Set iCalUID: {clean_uid}")
             else:
-                self.logger.warning(f"Event UID is empty after cleaning: '{event.uid}'")
+                self.logger.warning("Event UID is empty after cleaning: '%s'", event.uid)
         
-        if event.all_day:
-            # All-day event - ensure valid date format
-            try:
-                start_date = event.start.strftime('%Y-%m-%d')
-                end_date = event.end.strftime('%Y-%m-%d')
-                google_event['start'] = {'date': start_date}
-                google_event['end'] = {'date': end_date}
-                self.logger.debug(f"Set all-day dates: {start_date} to {end_date}")
-            except Exception as e:
-                self.logger.error(f"Failed to format all-day dates: {e}")
-                raise CalendarServiceError(f"Invalid date format for all-day event: {e}")
-        else:
-            # Timed event - ensure valid datetime format
-            try:
-                start_dt = event.start.isoformat()
-                end_dt = event.end.isoformat()
-                google_event['start'] = {'dateTime': start_dt}
-                google_event['end'] = {'dateTime': end_dt}
-                self.logger.debug(f"Set timed datetimes: {start_dt} to {end_dt}")
-            except Exception as e:
-                self.logger.error(f"Failed to format datetime: {e}")
-                raise CalendarServiceError(f"Invalid datetime format for timed event: {e}")
+        try:
+            google_event['start'] = self._format_datetime_for_google(event.start, event.all_day)
+            google_event['end'] = self._format_datetime_for_google(event.end, event.all_day)
+        except Exception as e:
+            kind = 'all-day' if event.all_day else 'timed'
+            self.logger.error("Failed to format %s event dates: %s", kind, e)
+            raise CalendarServiceError(f"Invalid date format for {kind} event: {e}")
         
         # Add sequence for conflict resolution
         if event.sequence is not None:
@@ -1153,58 +1831,63 @@ class GoogleCalendarService(BaseCalendarService):
         # CRITICAL: Handle recurrence overrides properly
         if event.recurrence_overrides:
             for override in event.recurrence_overrides:
-                if override.get('type') == 'recurrence-id' and override.get('is_override'):
+                get = override.get
+                if get('type') == 'recurrence-id' and get('is_override'):
                     # This is a recurrence exception - set the recurringEventId
-                    if override.get('master_event_id'):
-                        google_event['recurringEventId'] = override['master_event_id']
+                    master_event_id = get('master_event_id')
+                    if master_event_id:
+                        google_event['recurringEventId'] = master_event_id
                         
                         # CRITICAL: Remove custom event ID for true recurrence overrides
                         # Google Calendar will assign its own ID for exception instances
-                        if 'id' in google_event:
-                            removed_id = google_event.pop('id')
-                            self.logger.info(f"🗑️  Removed custom ID '{removed_id}' for recurrence exception (Google will assign its own)")
+                        google_event.pop('id', None)
                     
                     # CRITICAL FIX: Set originalStartTime for Google Calendar exception events
                     # Google requires this field for recurrence exceptions
-                    original_start = override.get('original_start') or override.get('recurrence_id')
+                    original_start = get('original_start') or get('recurrence_id')
                     if original_start:
                         try:
                             # Parse the original start time
-                            from dateutil.parser import parse as parse_date
                             original_dt = parse_date(original_start)
                             
-                            if event.all_day:
-                                google_event['originalStartTime'] = {
-                                    'date': original_dt.strftime('%Y-%m-%d')
-                                }
-                            else:
-                                google_event['originalStartTime'] = {
-                                    'dateTime': original_dt.isoformat()
-                                }
-                            self.logger.info(f"✅ Set originalStartTime for recurrence exception: {original_start}")
+                            google_event['originalStartTime'] = self._format_datetime_for_google(
+                                original_dt, event.all_day
+                            )
                         except Exception as e:
-                            self.logger.warning(f"Failed to parse originalStartTime from {original_start}: {e}")
+                            self.logger.warning("Failed to parse originalStartTime from %s: %s", original_start, e)
                     else:
-                        self.logger.warning(f"Missing original start time for recurrence exception: {event.summary}")
+                        self.logger.warning("Missing original start time for recurrence exception: %s", event.summary)
         
-        # Add attendees if present
+        # Add attendees if present; Google rejects attendees without an email address
         if event.attendees:
-            google_event['attendees'] = []
-            for attendee in event.attendees:
-                google_attendee = {
-                    'email': attendee.get('email', ''),
-                    'responseStatus': attendee.get('responseStatus', 'needsAction')
+            google_attendees = [
+                {
+                    'email': attendee['email'],
+                    'responseStatus': attendee.get('responseStatus', 'needsAction'),
+                    **({'displayName': attendee['displayName']} if attendee.get('displayName') else _EMPTY)
                 }
-                if attendee.get('displayName'):
-                    google_attendee['displayName'] = attendee['displayName']
-                google_event['attendees'].append(google_attendee)
+                for attendee in event.attendees
+                if attendee.get('email')
+            ]
+            if google_attendees:
+                google_event['attendees'] = google_attendees
         
+        self.logger.debug(
+            "Converted event uid=%s to Google format: id=%s start=%s end=%s recurringEventId=%s",
+            event.uid, google_event.get('id'), google_event['start'], google_event['end'],
+            google_event.get('recurringEventId')
+        )
         return google_event
     
     async def close(self) -> None:
         """Clean up resources."""
+        # Send anything still queued for batching before tearing down
+        self._start_batch_flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
         if self._http_client:
             await self._http_client.aclose()
+        await super().close()
     
     async def get_sync_token(self, calendar_id: str) -> str:
         """Get a sync token for incremental sync.
@@ -1225,59 +1908,53 @@ class GoogleCalendarService(BaseCalendarService):
             page_token = None
             sync_token = None
             
-            self.logger.info(f"📊 Google API: Acquiring sync token without time bounds")
+            self.logger.debug("📊 Google API: Acquiring sync token without time bounds")
             page_count = 0
-            total_events = 0
+            
+            base_params = {
+                'calendarId': calendar_id,
+                'maxResults': EVENTS_PAGE_SIZE,
+                'singleEvents': True,
+                'showDeleted': True,  # Required for sync tokens
+                # Only the tokens are needed; skip transferring event bodies
+                'fields': 'nextPageToken,nextSyncToken',
+            }
             
             while True:
                 page_count += 1
-                params = {
-                    'calendarId': calendar_id,
-                    'maxResults': 250,  # Max per page
-                    'singleEvents': True,
-                    'showDeleted': True,  # Required for sync tokens
-                }
+                params = base_params
                 if page_token:
-                    params['pageToken'] = page_token
+                    params = {**base_params, 'pageToken': page_token}
                 
-                self.logger.info(f"📄 Google API: Requesting page {page_count} (maxResults=250)")
-                self.logger.info(f"🔧 Google API: Request params: {params}")
+                self.logger.debug("📄 Google API: Requesting page %d, params: %s", page_count, params)
                 
                 try:
-                    result = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.service.events().list(**params).execute()
+                    result = await self._execute(
+                        self.service.events().list(**params)
                     )
-                    self.logger.info(f"✅ Google API: Request successful")
                 except Exception as e:
-                    self.logger.error(f"❌ Google API: Request failed: {type(e).__name__}: {e}")
+                    self.logger.error("❌ Google API: Request failed: %s: %s", type(e).__name__, e)
                     raise
                 
-                # Log response info
-                result_keys = list(result.keys()) if result else []
-                self.logger.info(f"🔍 Google API: Response keys: {result_keys}")
-                
-                events_this_page = len(result.get('items', []))
-                total_events += events_this_page
-                self.logger.info(f"📥 Google API: Page {page_count} returned {events_this_page} events (total: {total_events})")
-                
                 # Check for next page
                 page_token = result.get('nextPageToken')
                 sync_token_on_page = result.get('nextSyncToken')
                 
-                self.logger.info(f"🔄 Google API: Page {page_count} - nextPageToken: {'✅' if page_token else '❌'} | nextSyncToken: {'✅' if sync_token_on_page else '❌'}")
+                self.logger.debug(
+                    "🔄 Google API: Page %d - nextPageToken: %s | nextSyncToken: %s",
+                    page_count, bool(page_token), bool(sync_token_on_page)
+                )
                 
                 # Sync token is only available on the final page
                 if not page_token:
                     sync_token = sync_token_on_page
-                    self.logger.info(f"🏁 Google API: Final page {page_count} reached - total events enumerated: {total_events}")
                     break
             
             if not sync_token:
-                self.logger.error(f"❌ Google API: No nextSyncToken found after {page_count} pages ({total_events} events)")
+                self.logger.error("❌ Google API: No nextSyncToken found after %s pages", page_count)
                 raise CalendarServiceError("No sync token returned from Google Calendar API after full pagination")
                 
-            self.logger.info(f"🎯 Google API: Sync token acquired successfully after {page_count} pages")
+            self.logger.info("🎯 Google API: Sync token acquired after %d pages", page_count)
             return sync_token
             
         except HttpError as e:
@@ -1335,10 +2012,7 @@ class GoogleCalendarService(BaseCalendarService):
         self._ensure_authenticated()
         
         try:
-            calendar_data = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.service.calendars().get(calendarId=calendar_id).execute()
-            )
+            calendar_data = await self._get_calendar_metadata(calendar_id)
             
             return {
                 'id': calendar_data['id'],
@@ -1353,10 +2027,10 @@ class GoogleCalendarService(BaseCalendarService):
         except HttpError as e:
             if e.resp.status == 404:
                 return None
-            self.logger.error(f"Failed to get Google calendar info: {e}")
+            self.logger.error("Failed to get Google calendar info: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"Failed to get Google calendar info: {e}")
+            self.logger.error("Failed to get Google calendar info: %s", e)
             return None
     
     def _format_datetime_for_google(self, dt: datetime, all_day: bool = False) -> Dict[str, str]:
@@ -1370,70 +2044,227 @@ class GoogleCalendarService(BaseCalendarService):
             Dictionary with formatted datetime
         """
         if all_day:
-            return {'date': dt.strftime('%Y-%m-%d')}
-        else:
-            return {'dateTime': dt.isoformat()}
+            return {'date': _format_date(dt)}
+        if dt.tzinfo is timezone.utc and not dt.microsecond:
+            # Common case for API-sourced times; skip isoformat's offset handling
+            return {
+                'dateTime': f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+                            f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+            }
+        return {'dateTime': dt.isoformat()}
     
-    async def list_upcoming_events(
+    async def iter_upcoming_events(
         self, 
         calendar_id: str, 
         max_results: int = 10,
         time_min: Optional[datetime] = None
-    ) -> List[CalendarEvent]:
-        """Get upcoming events from a Google calendar.
+    ) -> AsyncIterator[CalendarEvent]:
+        """Yield upcoming events from a Google calendar as pages arrive.
         
         Args:
             calendar_id: Google calendar ID
-            max_results: Maximum number of events to return
+            max_results: Maximum number of events to yield
             time_min: Minimum time for events (default: now)
             
-        Returns:
-            List of upcoming calendar events
+        Yields:
+            Upcoming calendar events
         """
         if time_min is None:
-            time_min = datetime.now(pytz.UTC)
+            time_min = datetime.now(timezone.utc)
         
-        events = []
         async for event in self.get_events(
             calendar_id, 
             time_min=time_min,
             max_results=max_results
         ):
-            events.append(event)
+            yield event
+    
+    async def list_upcoming_events(
+        self, 
+        calendar_id: str, 
+        max_results: int = 10,
+        time_min: Optional[datetime] = None
+    ) -> List[CalendarEvent]:
+        """Get upcoming events from a Google calendar.
+        
+        Prefer iter_upcoming_events when events can be processed one at a time.
+        
+        Args:
+            calendar_id: Google calendar ID
+            max_results: Maximum number of events to return
+            time_min: Minimum time for events (default: now)
             
-        return events
+        Returns:
+            List of upcoming calendar events
+        """
+        return [
+            event async for event in self.iter_upcoming_events(
+                calendar_id, max_results=max_results, time_min=time_min
+            )
+        ]
     
     async def batch_update_events(
         self,
         calendar_id: str,
-        event_updates: List[Tuple[str, CalendarEvent]]
+        event_updates: List[Tuple[str, CalendarEvent]],
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> List[Dict[str, Any]]:
         """Update multiple events in batch.
         
         Args:
             calendar_id: Google calendar ID
             event_updates: List of (event_id, event_data) tuples
+            on_result: Optional callback invoked with each result as soon as
+                it completes, e.g. to report progress
             
         Returns:
-            List of update results
+            List of update results, in the order of event_updates
         """
-        results = []
+        # Enough in-flight updates to fill one batch per pooled connection
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests * BATCH_MAX_REQUESTS)
         
-        # Google Calendar API doesn't have native batch update for events
-        # Process sequentially with rate limiting
-        for event_id, event_data in event_updates:
+        # Convert every body before any I/O so bad events fail immediately and
+        # the tasks below only carry ready-to-send payloads
+        bodies: List[Any] = []
+        for _, event_data in event_updates:
             try:
-                updated_event = await self.update_event(calendar_id, event_id, event_data)
-                results.append({
+                bodies.append(self._convert_to_google_format(event_data))
+            except Exception as e:
+                bodies.append(CalendarServiceError(f"Failed to update Google event: {e}"))
+        
+        async def _update_one(
+            index: int, event_id: str, event_data: CalendarEvent
+        ) -> Tuple[int, Dict[str, Any]]:
+            try:
+                body = bodies[index]
+                if isinstance(body, Exception):
+                    raise body
+                async with semaphore:
+                    updated_event = await self._update_event(
+                        calendar_id, event_id, event_data, self._execute_batched,
+                        google_event_data=body
+                    )
+                return index, {
                     'event_id': event_id,
                     'success': True,
                     'updated_event': updated_event
-                })
+                }
             except Exception as e:
-                results.append({
+                return index, {
                     'event_id': event_id,
                     'success': False,
                     'error': str(e)
-                })
-                
-        return results
\ No newline at end of file
+                }
+        
+        # Updates issued together share multipart batch requests (up to
+        # BATCH_MAX_REQUESTS sub-requests each) instead of one call per event.
+        # Results are reported as they complete, then returned in input order.
+        results: List[Dict[str, Any]] = [{}] * len(event_updates)
+        for next_done in asyncio.as_completed([
+            _update_one(index, event_id, event_data)
+            for index, (event_id, event_data) in enumerate(event_updates)
+        ]):
+            index, result = await next_done
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+        return results
+    
+    async def batch_create_events(
+        self,
+        calendar_id: str,
+        events: List[CalendarEvent]
+    ) -> List[Dict[str, Any]]:
+        """Create multiple events, sharing multipart batch requests for the inserts.
+        
+        Args:
+            calendar_id: Google calendar ID
+            events: Events to create
+            
+        Returns:
+            List of {uid, success, created_event|error} results, in input order
+        """
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests * BATCH_MAX_REQUESTS)
+        
+        async def _create_one(event_data: CalendarEvent) -> Dict[str, Any]:
+            try:
+                async with semaphore:
+                    created_event = await self.create_event_batched(calendar_id, event_data)
+                return {
+                    'uid': event_data.uid,
+                    'success': True,
+                    'created_event': created_event
+                }
+            except Exception as e:
+                return {
+                    'uid': event_data.uid,
+                    'success': False,
+                    'error': str(e)
+                }
+        
+        return list(await asyncio.gather(*(_create_one(event) for event in events)))
+    
+    async def batch_delete_events(
+        self,
+        calendar_id: str,
+        event_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Delete multiple events, sharing multipart batch requests.
+        
+        Args:
+            calendar_id: Google calendar ID
+            event_ids: Google event IDs to delete
+            
+        Returns:
+            List of {event_id, success[, error]} results, in input order;
+            events that are already gone count as deleted
+        """
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests * BATCH_MAX_REQUESTS)
+        
+        async def _delete_one(event_id: str) -> Dict[str, Any]:
+            try:
+                async with semaphore:
+                    await self.delete_event_batched(calendar_id, event_id)
+            except EventNotFoundError:
+                pass
+            except Exception as e:
+                return {
+                    'event_id': event_id,
+                    'success': False,
+                    'error': str(e)
+                }
+            return {
+                'event_id': event_id,
+                'success': True
+            }
+        
+        return list(await asyncio.gather(*(_delete_one(event_id) for event_id in event_ids)))
+    
+    async def batch_get_events(
+        self,
+        calendar_id: str,
+        event_ids: List[str]
+    ) -> Dict[str, Optional[CalendarEvent]]:
+        """Fetch multiple events by ID through the batch queue.
+        
+        Args:
+            calendar_id: Google calendar ID
+            event_ids: Google event IDs to fetch
+            
+        Returns:
+            Mapping of event ID to its event, or None if it could not be fetched
+        """
+        self._ensure_authenticated()
+        
+        async def _get_one(event_id: str) -> Tuple[str, Optional[CalendarEvent]]:
+            try:
+                event_data = await self._execute_batched(
+                    self.service.events().get(calendarId=calendar_id, eventId=event_id)
+                )
+            except HttpError as e:
+                if e.resp.status != 404:
+                    self.logger.warning("Failed to fetch Google event %s: %s", event_id, e)
+                return event_id, None
+            return event_id, self._try_format_google_event(event_data)
+        
+        return dict(await asyncio.gather(*(_get_one(event_id) for event_id in event_ids)))
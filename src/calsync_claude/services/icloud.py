@@ -1,13 +1,14 @@
 """iCloud Calendar service implementation with async support."""
 
-import asyncio
+import functools
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from typing import Any, Dict, List, Optional, AsyncIterator, Set
 from urllib.parse import urljoin, urlparse
 
 import caldav
 from caldav import DAVClient
+from caldav.calendarobjectresource import Event
 import pytz
 from dateutil.parser import parse as parse_date
 from icalendar import Calendar, Event as ICalEvent
@@ -18,6 +19,18 @@ from ..models import CalendarEvent, CalendarInfo, EventSource, ChangeSet
 from ..config import Settings
 
 
+@functools.lru_cache(maxsize=None)
+def _get_timezone(name: str) -> tzinfo:
+    """pytz.timezone, memoized per name; unknown names still raise."""
+    return pytz.timezone(name)
+
+
+def _save_event_data(event: Event, data: str) -> None:
+    """Replace a CalDAV event's iCalendar data and save it to the server."""
+    event.data = data
+    event.save()
+
+
 class iCloudCalendarService(BaseCalendarService):
     """iCloud Calendar service with async support using CalDAV."""
     
@@ -35,19 +48,14 @@ class iCloudCalendarService(BaseCalendarService):
         """Authenticate with iCloud CalDAV."""
         try:
             # Run CalDAV connection in executor to avoid blocking
-            self.client = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: DAVClient(
-                    url=self.settings.icloud_server_url,
-                    username=self.settings.icloud_username,
-                    password=self.settings.icloud_password
-                )
+            self.client = await self._to_thread(
+                DAVClient,
+                url=self.settings.icloud_server_url,
+                username=self.settings.icloud_username,
+                password=self.settings.icloud_password
             )
             
-            self.principal = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.principal()
-            )
+            self.principal = await self._to_thread(self.client.principal)
             
             # CRITICAL FIX: Update client URL to match the server-specific URL
             # iCloud redirects from caldav.icloud.com to server-specific URLs like p65-caldav.icloud.com
@@ -68,19 +76,14 @@ class iCloudCalendarService(BaseCalendarService):
                 # Update client to use server-specific URL
                 if server_base_url != self.settings.icloud_server_url:
                     self.logger.info(f"🔧 Updating iCloud CalDAV URL from {self.settings.icloud_server_url} to {server_base_url}")
-                    self.client = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: DAVClient(
-                            url=server_base_url,
-                            username=self.settings.icloud_username,
-                            password=self.settings.icloud_password
-                        )
+                    self.client = await self._to_thread(
+                        DAVClient,
+                        url=server_base_url,
+                        username=self.settings.icloud_username,
+                        password=self.settings.icloud_password
                     )
                     # Re-get principal with updated client
-                    self.principal = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.client.principal()
-                    )
+                    self.principal = await self._to_thread(self.client.principal)
                     self.logger.info(f"✅ Successfully updated client to use {server_base_url}")
                 else:
                     self.logger.info(f"📍 Server URL unchanged: {server_base_url}")
@@ -99,19 +102,13 @@ class iCloudCalendarService(BaseCalendarService):
         
         try:
             # Get calendars from CalDAV
-            calendars = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.principal.calendars()
-            )
+            calendars = await self._to_thread(self.principal.calendars)
             
             calendar_infos = []
             for i, cal in enumerate(calendars):
                 try:
                     # Get calendar properties
-                    cal_props = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: cal.get_properties([caldav.dav.DisplayName()])
-                    )
+                    cal_props = await self._to_thread(cal.get_properties, [caldav.dav.DisplayName()])
                     
                     name = cal_props.get(caldav.dav.DisplayName.tag, f"Calendar {i + 1}")
                     
@@ -199,10 +196,7 @@ class iCloudCalendarService(BaseCalendarService):
                 else:
                     # Fallback to date search for initial sync
                     # WARNING: This cannot detect deletions reliably
-                    events = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: calendar.date_search(start=time_min, end=time_max)
-                    )
+                    events = await self._to_thread(calendar.date_search, start=time_min, end=time_max)
             except Exception as e:
                 if "429" in str(e) or "throttl" in str(e).lower():
                     self.logger.warning("iCloud CalDAV throttled, retrying with backoff...")
@@ -273,19 +267,13 @@ class iCloudCalendarService(BaseCalendarService):
                     current_ctag = sync_token[5:]  # Remove "ctag:" prefix
                     
                     # Get current calendar CTag
-                    props = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: calendar.get_properties([caldav.dav.GetEtag()])
-                    )
+                    props = await self._to_thread(calendar.get_properties, [caldav.dav.GetEtag()])
                     new_ctag = props.get(caldav.dav.GetEtag.tag)
                     
                     if new_ctag and new_ctag != current_ctag:
                         # CTag changed - do full sync but mark as using sync token
                         self.logger.info(f"📊 CTag changed ({current_ctag} → {new_ctag}), full sync needed")
-                        events = await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: calendar.date_search(start=time_min, end=time_max)
-                        )
+                        events = await self._to_thread(calendar.date_search, start=time_min, end=time_max)
                         count = 0
                         for ev in events:
                             if max_results and count >= max_results:
@@ -311,10 +299,7 @@ class iCloudCalendarService(BaseCalendarService):
                     self.logger.info(f"  Calendar ID: {calendar_id}")
                     self.logger.info(f"  Time range: {time_min} to {time_max}")
                     
-                    events = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: calendar.date_search(start=time_min, end=time_max)
-                    )
+                    events = await self._to_thread(calendar.date_search, start=time_min, end=time_max)
                     count = 0
                     for ev in events:
                         if max_results and count >= max_results:
@@ -344,12 +329,11 @@ class iCloudCalendarService(BaseCalendarService):
                     self.logger.info(f"  Sync token: {sync_token[:50]}..." if sync_token else "  No sync token")
                     self.logger.info(f"📤 DEBUG: About to send sync-collection REPORT request")
                     
-                    response = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.client.request(
-                            calendar.url,
-                            "REPORT",
-                            f"""<?xml version=\"1.0\" encoding=\"utf-8\" ?>
+                    response = await self._to_thread(
+                        self.client.request,
+                        calendar.url,
+                        "REPORT",
+                        f"""<?xml version=\"1.0\" encoding=\"utf-8\" ?>
 <D:sync-collection xmlns:D=\"DAV:\" xmlns:C=\"urn:ietf:params:xml:ns:caldav\">
   <D:sync-token>{sync_token}</D:sync-token>
   <D:sync-level>1</D:sync-level>
@@ -358,12 +342,11 @@ class iCloudCalendarService(BaseCalendarService):
     <C:calendar-data/>
   </D:prop>
 </D:sync-collection>""",
-                            headers={
-                                "Content-Type": "application/xml; charset=utf-8",
-                                "Depth": "1",
-                                "Prefer": "return-minimal"
-                            }
-                        )
+                        headers={
+                            "Content-Type": "application/xml; charset=utf-8",
+                            "Depth": "1",
+                            "Prefer": "return-minimal"
+                        }
                     )
 
                     self.logger.info(f"📥 DEBUG: Received sync-collection response, parsing...")
@@ -382,10 +365,7 @@ class iCloudCalendarService(BaseCalendarService):
                         deleted_native_ids.add(href)
             else:
                 # Fallback: time range snapshot (no deletions detection)
-                events = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: calendar.date_search(start=time_min, end=time_max)
-                )
+                events = await self._to_thread(calendar.date_search, start=time_min, end=time_max)
                 count = 0
                 for ev in events:
                     if max_results and count >= max_results:
@@ -475,10 +455,7 @@ class iCloudCalendarService(BaseCalendarService):
                 raise CalendarServiceError(f"iCloud calendar {calendar_id} not found")
             
             # Search for event by UID
-            events = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.events()
-            )
+            events = await self._to_thread(calendar.events)
             
             for event in events:
                 try:
@@ -521,10 +498,7 @@ class iCloudCalendarService(BaseCalendarService):
             try:
                 # Check if an event with the same UID already exists
                 if event_data.uid:
-                    existing_events = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: calendar.events()
-                    )
+                    existing_events = await self._to_thread(calendar.events)
                     
                     for existing_event in existing_events:
                         try:
@@ -538,10 +512,7 @@ class iCloudCalendarService(BaseCalendarService):
                             continue
                 
                 # Create event
-                created_event = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: calendar.save_event(ical_data)
-                )
+                created_event = await self._to_thread(calendar.save_event, ical_data)
                 
                 return self._parse_caldav_event(created_event)
                 
@@ -566,10 +537,7 @@ class iCloudCalendarService(BaseCalendarService):
                     modified_ical_data = self._create_ical_event(modified_event_data)
                     
                     try:
-                        created_event = await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: calendar.save_event(modified_ical_data)
-                        )
+                        created_event = await self._to_thread(calendar.save_event, modified_ical_data)
                         self.logger.info(
                             f"Successfully created event with modified UID: {modified_event_data.uid}"
                         )
@@ -602,10 +570,7 @@ class iCloudCalendarService(BaseCalendarService):
             
             # Find the CalDAV event object
             calendar = await self._find_calendar_by_id(calendar_id)
-            events = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.events()
-            )
+            events = await self._to_thread(calendar.events)
             
             caldav_event = None
             for event in events:
@@ -622,10 +587,7 @@ class iCloudCalendarService(BaseCalendarService):
             # Update the event
             ical_data = self._create_ical_event(event_data)
             
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: setattr(caldav_event, 'data', ical_data) or caldav_event.save()
-            )
+            await self._to_thread(_save_event_data, caldav_event, ical_data)
             
             return self._parse_caldav_event(caldav_event)
             
@@ -641,18 +603,12 @@ class iCloudCalendarService(BaseCalendarService):
         try:
             # Find the CalDAV event object
             calendar = await self._find_calendar_by_id(calendar_id)
-            events = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.events()
-            )
+            events = await self._to_thread(calendar.events)
             
             for event in events:
                 try:
                     if self._extract_uid_from_caldav_event(event) == event_id:
-                        await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: event.delete()
-                        )
+                        await self._to_thread(event.delete)
                         return
                 except Exception:
                     continue
@@ -671,10 +627,7 @@ class iCloudCalendarService(BaseCalendarService):
             calendar = await self._find_calendar_by_id(calendar_id)
             if not calendar:
                 raise CalendarServiceError(f"iCloud calendar {calendar_id} not found")
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.request(href, "DELETE")
-            )
+            await self._to_thread(self.client.request, href, "DELETE")
         except Exception as e:
             raise CalendarServiceError(f"Failed to delete iCloud resource {href}: {e}")
 
@@ -686,10 +639,7 @@ class iCloudCalendarService(BaseCalendarService):
             if not calendar:
                 raise CalendarServiceError(f"iCloud calendar {calendar_id} not found")
             # Find the event by href
-            events = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.events()
-            )
+            events = await self._to_thread(calendar.events)
             target = None
             for ev in events:
                 if str(ev.url) == href:
@@ -714,10 +664,7 @@ class iCloudCalendarService(BaseCalendarService):
             except Exception:
                 pass
             updated_ics = cal.to_ical().decode('utf-8')
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: setattr(target, 'data', updated_ics) or target.save()
-            )
+            await self._to_thread(_save_event_data, target, updated_ics)
         except Exception as e:
             raise CalendarServiceError(f"Failed to add EXDATE to {href}: {e}")
 
@@ -750,10 +697,7 @@ class iCloudCalendarService(BaseCalendarService):
                 raise CalendarServiceError(f"iCloud calendar {calendar_id} not found")
             
             # Find the master recurring event by UID
-            events = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.events()
-            )
+            events = await self._to_thread(calendar.events)
             
             master_event = None
             for event in events:
@@ -814,10 +758,7 @@ class iCloudCalendarService(BaseCalendarService):
                 
                 # Save the updated master event
                 updated_ics = cal.to_ical().decode('utf-8')
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: setattr(master_event, 'data', updated_ics) or master_event.save()
-                )
+                await self._to_thread(_save_event_data, master_event, updated_ics)
                 
                 return self._parse_caldav_event(master_event)
                 
@@ -852,10 +793,7 @@ class iCloudCalendarService(BaseCalendarService):
                     
                     # Save the updated calendar with both master and exception
                     updated_ics = cal.to_ical().decode('utf-8')
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: setattr(master_event, 'data', updated_ics) or master_event.save()
-                    )
+                    await self._to_thread(_save_event_data, master_event, updated_ics)
                     
                     # Return the exception event data
                     return exception_event
@@ -869,10 +807,7 @@ class iCloudCalendarService(BaseCalendarService):
     
     async def _find_calendar_by_id(self, calendar_id: str):
         """Find calendar object by ID."""
-        calendars = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: self.principal.calendars()
-        )
+        calendars = await self._to_thread(self.principal.calendars)
         
         for calendar in calendars:
             if str(calendar.url) == calendar_id:
@@ -1073,7 +1008,7 @@ class iCloudCalendarService(BaseCalendarService):
             if event_data.timezone:
                 # Try to preserve original timezone
                 try:
-                    tz = pytz.timezone(event_data.timezone)
+                    tz = _get_timezone(event_data.timezone)
                     start_local = event_data.start.astimezone(tz)
                     end_local = event_data.end.astimezone(tz)
                     event.add('dtstart', start_local)
@@ -1148,14 +1083,12 @@ class iCloudCalendarService(BaseCalendarService):
 </D:sync-collection>"""
 
             # Execute the sync query
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.request(
-                    calendar.url, 
-                    "REPORT", 
-                    sync_query,
-                    headers={"Content-Type": "application/xml; charset=utf-8"}
-                )
+            response = await self._to_thread(
+                self.client.request,
+                calendar.url, 
+                "REPORT", 
+                sync_query,
+                headers={"Content-Type": "application/xml; charset=utf-8"}
             )
             
             # Parse the sync-collection response
@@ -1165,10 +1098,7 @@ class iCloudCalendarService(BaseCalendarService):
         except Exception as e:
             self.logger.error(f"CalDAV sync-collection failed: {e}")
             # Fall back to regular date search
-            return await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.events()
-            )
+            return await self._to_thread(calendar.events)
     
     async def _parse_propfind_sync_token(self, response) -> Optional[str]:
         """Parse sync token from PROPFIND response."""
@@ -1270,10 +1200,7 @@ class iCloudCalendarService(BaseCalendarService):
             # Skip if content doesn't appear to be XML
             if not content.strip().startswith('<?xml') and not content.strip().startswith('<'):
                 self.logger.debug(f"Sync-collection content doesn't appear to be XML: {content[:100]}")
-                return await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: calendar.events()
-                )
+                return await self._to_thread(calendar.events)
             
             # Parse XML response
             root = ET.fromstring(content)
@@ -1328,10 +1255,7 @@ class iCloudCalendarService(BaseCalendarService):
         except ET.ParseError as e:
             self.logger.error(f"Failed to parse CalDAV sync-collection XML response: {e}")
             # Fall back to regular events query
-            return await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.events()
-            )
+            return await self._to_thread(calendar.events)
 
     async def _parse_sync_collection_token(self, response) -> Optional[str]:
         """Parse sync token from sync-collection REPORT response according to RFC 6578."""
@@ -1547,10 +1471,7 @@ class iCloudCalendarService(BaseCalendarService):
             except Exception as fallback_error:
                 self.logger.error(f"Fallback sync-collection parsing also failed: {fallback_error}")
                 # Final fallback to regular events query
-                return await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: calendar.events()
-                ), [], None
+                return await self._to_thread(calendar.events), [], None
     
     async def get_sync_token(self, calendar_id: str) -> str:
         """Get a CalDAV sync token (DAV:sync-token) for incremental sync.
@@ -1578,23 +1499,21 @@ class iCloudCalendarService(BaseCalendarService):
             # STRATEGY 1: Use PROPFIND for initial sync token (more compatible with iCloud)
             try:
                 self.logger.info(f"📊 Attempt 1: PROPFIND for initial DAV:sync-token")
-                response = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.client.request(
-                        calendar.url,
-                        "PROPFIND",
-                        """<?xml version="1.0" encoding="utf-8" ?>
+                response = await self._to_thread(
+                    self.client.request,
+                    calendar.url,
+                    "PROPFIND",
+                    """<?xml version="1.0" encoding="utf-8" ?>
 <D:propfind xmlns:D="DAV:">
   <D:prop>
     <D:sync-token/>
     <D:getetag/>
   </D:prop>
 </D:propfind>""",
-                        headers={
-                            "Content-Type": "application/xml; charset=utf-8",
-                            "Depth": "0"
-                        }
-                    )
+                    headers={
+                        "Content-Type": "application/xml; charset=utf-8",
+                        "Depth": "0"
+                    }
                 )
                 
                 # Parse PROPFIND response for sync-token
@@ -1613,12 +1532,11 @@ class iCloudCalendarService(BaseCalendarService):
             # STRATEGY 2: Try sync-collection without initial token (RFC 6578 compliant)
             try:
                 self.logger.info(f"📊 Attempt 2: RFC 6578 compliant sync-collection for initial state")
-                response = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.client.request(
-                        calendar.url,
-                        "REPORT",
-                        """<?xml version="1.0" encoding="utf-8"?>
+                response = await self._to_thread(
+                    self.client.request,
+                    calendar.url,
+                    "REPORT",
+                    """<?xml version="1.0" encoding="utf-8"?>
 <D:sync-collection xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">
   <D:sync-token/>
   <D:sync-level>1</D:sync-level>
@@ -1627,12 +1545,11 @@ class iCloudCalendarService(BaseCalendarService):
     <C:calendar-data/>
   </D:prop>
 </D:sync-collection>""",
-                        headers={
-                            "Content-Type": "application/xml; charset=utf-8",
-                            "User-Agent": "CalSync/2.0 (CalDAV Client)",
-                            "Accept": "application/xml, text/xml"
-                        }
-                    )
+                    headers={
+                        "Content-Type": "application/xml; charset=utf-8",
+                        "User-Agent": "CalSync/2.0 (CalDAV Client)",
+                        "Accept": "application/xml, text/xml"
+                    }
                 )
                 # Parse sync-collection response for new sync-token
                 sync_token = await self._parse_sync_collection_token(response)
@@ -1652,12 +1569,12 @@ class iCloudCalendarService(BaseCalendarService):
                 self.logger.info(f"📊 Attempt 3: Enhanced CTag fallback")
                 
                 # Get multiple properties to ensure we have the most current state
-                props = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: calendar.get_properties([
+                props = await self._to_thread(
+                    calendar.get_properties,
+                    [
                         caldav.dav.GetEtag(),
                         caldav.dav.GetCtag() if hasattr(caldav.dav, 'GetCtag') else caldav.dav.GetEtag()
-                    ])
+                    ]
                 )
                 
                 # Try GetCtag first (collection-level ETag), then GetEtag
@@ -1839,13 +1756,13 @@ class iCloudCalendarService(BaseCalendarService):
                 return None
             
             # Get calendar properties
-            props = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: calendar.get_properties([
+            props = await self._to_thread(
+                calendar.get_properties,
+                [
                     caldav.dav.DisplayName(),
                     caldav.dav.GetEtag(),
                     caldav.dav.SupportedCalendarComponentSet()
-                ])
+                ]
             )
             
             return {
@@ -1923,7 +1840,7 @@ class iCloudCalendarService(BaseCalendarService):
             
             # Validate it's a known timezone
             try:
-                pytz.timezone(timezone_str)
+                _get_timezone(timezone_str)
                 return timezone_str
             except pytz.exceptions.UnknownTimeZoneError:
                 self.logger.debug(f"Unknown timezone: {timezone_str}, defaulting to UTC")
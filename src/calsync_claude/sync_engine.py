@@ -165,6 +165,8 @@ class SyncEngine:
         """Clean up resources."""
         if hasattr(self.google_service, 'close'):
             await self.google_service.close()
+        if hasattr(self.icloud_service, 'close'):
+            await self.icloud_service.close()
         
         self.logger.info("Sync engine cleaned up")
     
@@ -235,6 +237,9 @@ class SyncEngine:
             await self._authenticate_services()
             self.logger.info("✅ AUTH: Services authenticated")
         
+        # Events may have changed on the server since the previous pass
+        self.google_service.invalidate_content_index()
+        
         # Create sync session
         self.logger.info("🔧 SESSION: Creating sync session...")
         with self.db_manager.get_session() as session:
@@ -262,7 +267,7 @@ class SyncEngine:
             self.logger.info(f"🔍 SYNC STEP 2: Syncing {len(calendar_mappings)} calendar pairs")
             
             # Perform bidirectional sync for each mapped calendar pair
-            for i, mapping in enumerate(calendar_mappings, 1):
+            async def sync_pair(i: int, mapping: CalendarMappingDB) -> None:
                 self.logger.info(f"📅 SYNC STEP 2.{i}: Starting calendar pair {mapping.google_calendar_name} <-> {mapping.icloud_calendar_name}")
                 await self._sync_calendar_pair(
                     mapping.google_calendar_id,
@@ -274,6 +279,19 @@ class SyncEngine:
                 )
                 self.logger.info(f"✅ SYNC STEP 2.{i} COMPLETE: Finished calendar pair {mapping.google_calendar_name} <-> {mapping.icloud_calendar_name}")
             
+            # Pairs touch disjoint calendars and each DB access opens its own
+            # short session, so pairs run concurrently and their network
+            # waits overlap; the services' own limits still bound the requests.
+            # Every pair finishes before a failure is reported, so none is
+            # left writing after the session is marked failed.
+            results = await asyncio.gather(
+                *(sync_pair(i, mapping) for i, mapping in enumerate(calendar_mappings, 1)),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            
             self.logger.info("🔍 SYNC STEP 3: Completing sync session...")
             # Complete sync session
             with self.db_manager.get_session() as session:
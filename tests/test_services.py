@@ -0,0 +1,725 @@
+"""Tests for calendar service helpers."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from email.parser import BytesParser
+from zoneinfo import ZoneInfo
+
+import httplib2
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from pydantic_settings import SettingsConfigDict
+
+from calsync_claude.config import Settings
+from calsync_claude.models import CalendarEvent, EventSource
+from calsync_claude.services.base import AsyncTokenBucket
+from calsync_claude.services.google import (
+    BATCH_URI, CALENDAR_CACHE_TTL_SECONDS, GoogleCalendarService, RETRY_MAX_DELAY_SECONDS, _OrjsonModel,
+    _is_retryable, _retry_delay
+)
+
+
+class TestSettings(Settings):
+    """Test-specific settings that don't read from .env files."""
+    model_config = SettingsConfigDict(
+        env_file=None,  # Don't read from .env files
+        case_sensitive=False,
+        extra="ignore",
+        secrets_dir=None  # Don't read from secrets directory
+    )
+
+
+@pytest.fixture
+def google_service(tmp_path):
+    settings = TestSettings(
+        google_client_id='x'*20,
+        google_client_secret='y'*20,
+        icloud_username='user@example.com',
+        icloud_password='abcd-efgh-ijkl-mnop',
+        database_url=f'sqlite:///{tmp_path}/test.db'
+    )
+    return GoogleCalendarService(settings)
+
+
+def _connect(service, handler, refresh_token='refresh', expires_in=timedelta(hours=1)):
+    """Authenticate service offline, sending its HTTP traffic to handler."""
+    creds = Credentials(
+        token='token-1',
+        refresh_token=refresh_token,
+        client_id='id',
+        client_secret='secret',
+        token_uri='https://oauth2.googleapis.com/token',
+        expiry=datetime.now(timezone.utc).replace(tzinfo=None) + expires_in
+    )
+    service._credentials = creds
+    service.service = build(
+        'calendar', 'v3', credentials=creds, model=_OrjsonModel(),
+        cache_discovery=False, static_discovery=True
+    )
+    service._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    # Tests shouldn't wait on the per-user quota pacing
+    service._api_limiter = AsyncTokenBucket(rate_per_second=10000, capacity=1000)
+    service._authenticated = True
+    return creds
+
+
+def _batch_parts(request):
+    """Parse a multipart batch request into (Content-ID, request line) pairs."""
+    message = BytesParser().parsebytes(
+        b'content-type: ' + request.headers['content-type'].encode() + b'\r\n\r\n' + request.content
+    )
+    return [
+        (part['Content-ID'], part.get_payload().split('\n', 1)[0])
+        for part in message.get_payload()
+    ]
+
+
+def _batch_response(parts, respond):
+    """Build a multipart batch response; respond maps a request line to (status, body)."""
+    chunks = []
+    for content_id, request_line in parts:
+        status, body = respond(request_line)
+        chunks.append(
+            f"--batch\r\nContent-Type: application/http\r\n"
+            f"Content-ID: <response-{content_id[1:]}\r\n\r\n"
+            f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps(body)}\r\n"
+        )
+    return httpx.Response(
+        200,
+        headers={'content-type': 'multipart/mixed; boundary=batch'},
+        content=(''.join(chunks) + '--batch--\r\n').encode()
+    )
+
+
+class TestAsyncTokenBucket:
+    """Tests for AsyncTokenBucket rate limiter."""
+
+    async def test_burst_within_capacity_does_not_wait(self):
+        """Test that a burst up to capacity is served immediately."""
+        bucket = AsyncTokenBucket(rate_per_second=1, capacity=5)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(5):
+            async with bucket:
+                pass
+
+        assert loop.time() - start < 0.5
+
+    async def test_waits_for_refill_when_empty(self):
+        """Test that acquiring beyond capacity waits for a refill."""
+        bucket = AsyncTokenBucket(rate_per_second=20, capacity=1)
+        loop = asyncio.get_running_loop()
+
+        await bucket.acquire()
+        start = loop.time()
+        await bucket.acquire()
+
+        assert loop.time() - start >= 0.04
+
+
+class TestGoogleEventIds:
+    """Tests for deterministic Google event ID generation."""
+
+    @pytest.mark.parametrize("uid, expected", [
+        ("UID-1", "h5fp562prtshkmadd26fltlbdi0qg7fl"),
+        ("ABCD-1234@icloud.com", "e63rotc9pt0jlsb5e1iq46v7ajvl0hik"),
+        ("event-123", "ls6c3kk4347n1t5auda5f2ufvivbton0"),
+    ])
+    def test_ids_are_stable(self, google_service, uid, expected):
+        """Test that IDs match those already stored for existing events."""
+        assert google_service._generate_compliant_event_id(uid) == expected
+
+    def test_ids_are_base32hex_and_start_with_letter(self, google_service):
+        """Test that generated IDs satisfy Google's event ID constraints."""
+        for i in range(200):
+            event_id = google_service._generate_compliant_event_id(f"uid-{i}")
+            assert len(event_id) == 32
+            assert set(event_id) <= set('0123456789abcdefghijklmnopqrstuv')
+            assert event_id[0].isalpha()
+
+    def test_blake2b_ids_are_compliant_and_distinct(self, google_service):
+        """Test that the opt-in blake2b scheme yields valid, different IDs."""
+        google_service.settings.google_event_id_hash = 'blake2b'
+        event_id = google_service._generate_compliant_event_id("UID-1")
+
+        assert len(event_id) == 32
+        assert set(event_id) <= set('0123456789abcdefghijklmnopqrstuv')
+        assert event_id != "h5fp562prtshkmadd26fltlbdi0qg7fl"
+
+
+class TestGoogleDateTimeFormatting:
+    """Tests for formatting datetimes for the Google API."""
+
+    def test_all_day_uses_date(self, google_service):
+        """Test that all-day values are formatted as YYYY-MM-DD."""
+        dt = datetime(2024, 3, 5, 12, 30, tzinfo=timezone.utc)
+        assert google_service._format_datetime_for_google(dt, all_day=True) == {'date': '2024-03-05'}
+
+    def test_utc_fast_path_matches_isoformat(self, google_service):
+        """Test that the UTC shortcut denotes the same instant as isoformat."""
+        dt = datetime(2024, 3, 5, 9, 7, 2, tzinfo=timezone.utc)
+        formatted = google_service._format_datetime_for_google(dt)['dateTime']
+
+        assert formatted == '2024-03-05T09:07:02Z'
+        assert datetime.fromisoformat(formatted.replace('Z', '+00:00')) == dt
+
+    def test_offsets_and_microseconds_use_isoformat(self, google_service):
+        """Test that non-UTC and sub-second values keep isoformat output."""
+        offset = datetime(2024, 3, 5, 9, 0, tzinfo=timezone(timedelta(hours=2)))
+        precise = datetime(2024, 3, 5, 9, 0, 0, 500, tzinfo=timezone.utc)
+
+        assert google_service._format_datetime_for_google(offset) == {'dateTime': offset.isoformat()}
+        assert google_service._format_datetime_for_google(precise) == {'dateTime': precise.isoformat()}
+
+
+def _http_error(status, content=b'{}', **headers):
+    resp = httplib2.Response({'status': status, **headers})
+    return HttpError(resp, content)
+
+
+class TestGoogleRetryPolicy:
+    """Tests for the transient-error retry policy."""
+
+    @pytest.mark.parametrize("status, content, expected", [
+        (429, b'{}', True),
+        (503, b'{}', True),
+        (403, b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}', True),
+        (403, b'{"error": {"errors": [{"reason": "forbidden"}]}}', False),
+        (404, b'{}', False),
+    ])
+    def test_is_retryable(self, status, content, expected):
+        """Test which API errors are treated as transient."""
+        assert _is_retryable(_http_error(status, content)) is expected
+
+    def test_transport_errors_are_retryable(self):
+        """Test that connection failures and timeouts are treated as transient."""
+        assert _is_retryable(httpx.ConnectError('refused'))
+        assert _is_retryable(httpx.ReadTimeout('timed out'))
+        assert _is_retryable(httpx.RemoteProtocolError('GOAWAY'))
+        assert not _is_retryable(ValueError('bad'))
+
+    async def test_transport_error_is_retried(self, google_service, monkeypatch):
+        """Test that a dropped connection is retried instead of failing the request."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) < 3:
+                raise httpx.ConnectError('connection reset', request=request)
+            return httpx.Response(200, json={'id': 'ev1'})
+
+        monkeypatch.setattr('calsync_claude.services.google._retry_delay', lambda error, previous: 0.0)
+        _connect(google_service, handler)
+
+        result = await google_service._execute(google_service.service.events().get(calendarId='cal', eventId='ev1'))
+
+        assert result == {'id': 'ev1'}
+        assert len(attempts) == 3
+
+    async def test_failed_batch_post_is_retried_per_request(self, google_service, monkeypatch):
+        """Test that requests of a batch whose POST times out are resent on their own."""
+        def handler(request):
+            if str(request.url) == BATCH_URI:
+                raise httpx.ReadTimeout('timed out', request=request)
+            return httpx.Response(200, json={'id': request.url.path.rsplit('/', 1)[1]})
+
+        monkeypatch.setattr('calsync_claude.services.google._retry_delay', lambda error, previous: 0.0)
+        _connect(google_service, handler)
+
+        results = await asyncio.gather(*(
+            google_service._execute_batched(
+                google_service.service.events().get(calendarId='cal', eventId=event_id)
+            ) for event_id in ('ev1', 'ev2')
+        ))
+
+        assert [r['id'] for r in results] == ['ev1', 'ev2']
+
+    def test_retry_after_header_is_honoured(self):
+        """Test that a numeric Retry-After sets the delay, capped at the maximum."""
+        assert _retry_delay(_http_error(429, **{'retry-after': '3'}), 1.0) == 3.0
+        assert _retry_delay(_http_error(429, **{'retry-after': '600'}), 1.0) == RETRY_MAX_DELAY_SECONDS
+
+    def test_jitter_stays_within_bounds(self):
+        """Test that jittered delays grow from the previous delay but stay capped."""
+        for _ in range(100):
+            assert 1.0 <= _retry_delay(_http_error(503), 2.0) <= 6.0
+            assert _retry_delay(_http_error(503), 100.0) <= RETRY_MAX_DELAY_SECONDS
+
+
+class TestGoogleBatching:
+    """Tests for multipart batches sent over the async HTTP client."""
+
+    async def test_concurrent_batches_resolve_their_own_requests(self, google_service):
+        """Test that overlapping batch flushes each resolve the right futures."""
+        posts = []
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            assert str(request.url) == BATCH_URI
+            assert request.headers['authorization'] == 'Bearer token-1'
+            posts.append(request)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+            def respond(request_line):
+                event_id = request_line.split()[1].split('?')[0].rsplit('/', 1)[1]
+                if event_id == 'missing':
+                    return 404, {'error': {'code': 404, 'message': 'Not Found'}}
+                return 200, {'id': event_id}
+            return _batch_response(_batch_parts(request), respond)
+
+        _connect(google_service, handler)
+        event_ids = [f'ev{i}' for i in range(120)] + ['missing']
+        results = await asyncio.gather(
+            *(google_service._execute_batched(
+                google_service.service.events().get(calendarId='cal', eventId=event_id)
+            ) for event_id in event_ids),
+            return_exceptions=True
+        )
+
+        assert len(posts) == 3
+        assert max_in_flight > 1
+        assert [r['id'] for r in results[:-1]] == event_ids[:-1]
+        assert isinstance(results[-1], HttpError) and results[-1].resp.status == 404
+
+
+def _server_event(**fields):
+    event = {
+        'id': 'ev1',
+        'iCalUID': 'uid-1',
+        'etag': '"1"',
+        'sequence': 2,
+        'summary': 'Standup',
+        'start': {'dateTime': '2024-03-05T09:00:00Z', 'timeZone': 'UTC'},
+        'end': {'dateTime': '2024-03-05T09:30:00Z', 'timeZone': 'UTC'},
+        'created': '2024-03-01T00:00:00Z',
+        'updated': '2024-03-01T00:00:00Z',
+    }
+    event.update(fields)
+    return event
+
+
+def _local_event(**fields):
+    values = {
+        'id': 'local-1',
+        'uid': 'uid-1',
+        'source': EventSource.ICLOUD,
+        'summary': 'Standup',
+        'start': datetime(2024, 3, 5, 9, 0, tzinfo=timezone.utc),
+        'end': datetime(2024, 3, 5, 9, 30, tzinfo=timezone.utc),
+    }
+    values.update(fields)
+    return CalendarEvent(**values)
+
+
+class TestGoogleEventPatch:
+    """Tests for the PATCH body _update_event sends."""
+
+    async def _patch(self, google_service, server_event, event):
+        """Run update_event against server_event; return the PATCH request, if any."""
+        patches = []
+
+        def handler(request):
+            if request.method == 'GET':
+                return httpx.Response(200, json=server_event)
+            patches.append(request)
+            # Like Google, merge nested objects and drop nulled keys
+            merged = dict(server_event)
+            for key, value in json.loads(request.content).items():
+                if isinstance(value, dict):
+                    value = {k: v for k, v in {**merged.get(key, {}), **value}.items() if v is not None}
+                merged[key] = value
+            return httpx.Response(200, json=merged)
+
+        _connect(google_service, handler)
+        await google_service.update_event('cal', 'ev1', event)
+        return patches[0] if patches else None
+
+    async def test_unchanged_event_sends_no_patch(self, google_service):
+        """Test that an event identical to the server copy isn't written."""
+        assert await self._patch(google_service, _server_event(), _local_event()) is None
+
+    async def test_unchanged_zoned_event_sends_no_patch(self, google_service):
+        """Test that Google's timeZone and offset rendering aren't taken for changes."""
+        berlin = ZoneInfo('Europe/Berlin')
+        server = _server_event(
+            start={'dateTime': '2024-03-05T10:00:00+01:00', 'timeZone': 'Europe/Berlin'},
+            end={'dateTime': '2024-03-05T10:30:00+01:00', 'timeZone': 'Europe/Berlin'},
+            sequence=0
+        )
+        event = _local_event(
+            start=datetime(2024, 3, 5, 10, 0, tzinfo=berlin),
+            end=datetime(2024, 3, 5, 9, 30, tzinfo=timezone.utc),
+            description='',
+            location=''
+        )
+
+        assert await self._patch(google_service, server, event) is None
+
+    async def test_moved_event_sends_new_time(self, google_service):
+        """Test that a real change of instant is still sent."""
+        event = _local_event(
+            start=datetime(2024, 3, 5, 10, 0, tzinfo=timezone.utc),
+            end=datetime(2024, 3, 5, 10, 30, tzinfo=timezone.utc)
+        )
+        body = json.loads((await self._patch(google_service, _server_event(), event)).content)
+
+        assert body == {
+            'start': {'date': None, 'dateTime': '2024-03-05T10:00:00Z'},
+            'end': {'date': None, 'dateTime': '2024-03-05T10:30:00Z'},
+            'sequence': 2
+        }
+
+    async def test_only_changed_fields_are_sent(self, google_service):
+        """Test that the body carries the diff, the server sequence and If-Match."""
+        request = await self._patch(google_service, _server_event(), _local_event(summary='Retro'))
+
+        assert json.loads(request.content) == {'summary': 'Retro', 'sequence': 2}
+        assert request.headers['if-match'] == '"1"'
+
+    async def test_removed_attendees_and_recurrence_are_nulled(self, google_service):
+        """Test that managed fields missing from the source are cleared."""
+        server = _server_event(
+            attendees=[{'email': 'a@example.com'}],
+            recurrence=['RRULE:FREQ=DAILY']
+        )
+        request = await self._patch(google_service, server, _local_event())
+
+        assert json.loads(request.content) == {'attendees': None, 'recurrence': None, 'sequence': 2}
+
+    async def test_timed_to_all_day_nulls_datetime(self, google_service):
+        """Test that switching to all-day clears dateTime and timeZone."""
+        server = _server_event(
+            start={'dateTime': '2024-03-05T09:00:00Z', 'timeZone': 'UTC'},
+            end={'dateTime': '2024-03-05T09:30:00Z', 'timeZone': 'UTC'}
+        )
+        event = _local_event(
+            start=datetime(2024, 3, 5, tzinfo=timezone.utc),
+            end=datetime(2024, 3, 6, tzinfo=timezone.utc),
+            all_day=True
+        )
+        body = json.loads((await self._patch(google_service, server, event)).content)
+
+        assert body['start'] == {'date': '2024-03-05', 'dateTime': None, 'timeZone': None}
+        assert body['end'] == {'date': '2024-03-06', 'dateTime': None, 'timeZone': None}
+
+    async def test_all_day_to_timed_nulls_date(self, google_service):
+        """Test that switching to a timed event clears date."""
+        server = _server_event(start={'date': '2024-03-05'}, end={'date': '2024-03-06'})
+        body = json.loads((await self._patch(google_service, server, _local_event())).content)
+
+        assert body['start'] == {'date': None, 'dateTime': '2024-03-05T09:00:00Z'}
+        assert body['end'] == {'date': None, 'dateTime': '2024-03-05T09:30:00Z'}
+
+
+class TestGoogleCalendarValidation:
+    """Tests for calendar ID validation and its fallback."""
+
+    def _handler(self, status, requested):
+        def handler(request):
+            if request.url.path.endswith('/users/me/calendarList'):
+                return httpx.Response(200, json={'items': [{'id': 'primary-cal', 'primary': True}]})
+            requested.append(request.url.path)
+            return httpx.Response(status, json={'error': {'code': status, 'message': 'x'}})
+        return handler
+
+    async def test_missing_calendar_fallback_is_remembered(self, google_service):
+        """Test that a 404 pins the fallback calendar without revalidating."""
+        requested = []
+        _connect(google_service, self._handler(404, requested))
+
+        assert await google_service._validate_calendar_id('gone') == 'primary-cal'
+        assert await google_service._validate_calendar_id('gone') == 'primary-cal'
+        assert len(requested) == 1
+
+    async def test_denied_calendar_fallback_is_not_remembered(self, google_service):
+        """Test that a 403 falls back for this call only."""
+        requested = []
+        _connect(google_service, self._handler(403, requested))
+
+        assert await google_service._validate_calendar_id('shared') == 'primary-cal'
+        assert 'shared' not in google_service._validated_calendars
+        await google_service._validate_calendar_id('shared')
+        assert len(requested) == 2
+
+
+class TestGoogleTokenRefresh:
+    """Tests for proactive access token refresh."""
+
+    def _expiring_creds(self, google_service, refresh_token):
+        # Inside TOKEN_REFRESH_MARGIN, but still valid by google-auth's own
+        # 3m45s threshold
+        return _connect(
+            google_service, lambda request: httpx.Response(200, json={}),
+            refresh_token=refresh_token, expires_in=timedelta(minutes=3, seconds=55)
+        )
+
+    async def test_refreshes_before_expiry(self, google_service, monkeypatch):
+        """Test that a token inside the margin is refreshed ahead of time."""
+        refreshed = []
+        monkeypatch.setattr(Credentials, 'refresh', lambda self, request: refreshed.append(self))
+        self._expiring_creds(google_service, 'refresh')
+
+        await google_service._ensure_token()
+
+        assert len(refreshed) == 1
+
+    async def test_access_only_token_is_used_until_expiry(self, google_service, monkeypatch):
+        """Test that a still-valid token without a refresh token isn't refreshed."""
+        refreshed = []
+        monkeypatch.setattr(Credentials, 'refresh', lambda self, request: refreshed.append(self))
+        creds = self._expiring_creds(google_service, None)
+
+        assert await google_service._ensure_token() is creds
+        assert refreshed == []
+
+
+class TestGoogleSend:
+    """Tests for single requests sent over the async HTTP client."""
+
+    async def test_request_is_sent_with_auth_and_decoded(self, google_service):
+        """Test the URL, method, headers and body sent, and the decoded result."""
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, json={'id': 'ev1', 'summary': 'Café'})
+
+        _connect(google_service, handler)
+        result = await google_service._execute(
+            google_service.service.events().patch(calendarId='cal', eventId='ev1', body={'summary': 'x'})
+        )
+
+        request = sent[0]
+        assert result == {'id': 'ev1', 'summary': 'Café'}
+        assert request.method == 'PATCH'
+        assert request.url.path == '/calendar/v3/calendars/cal/events/ev1'
+        assert request.headers['authorization'] == 'Bearer token-1'
+        assert request.headers['content-type'] == 'application/json'
+        assert json.loads(request.content) == {'summary': 'x'}
+
+    async def test_error_status_raises_http_error(self, google_service):
+        """Test that an error response surfaces as HttpError with status and reason."""
+        _connect(google_service, lambda request: httpx.Response(
+            404, json={'error': {'code': 404, 'message': 'Not Found'}}
+        ))
+
+        with pytest.raises(HttpError) as excinfo:
+            await google_service._execute(google_service.service.events().get(calendarId='cal', eventId='x'))
+
+        assert excinfo.value.resp.status == 404
+        assert excinfo.value.resp.reason == 'Not Found'
+        assert excinfo.value.resp['content-type'] == 'application/json'
+
+    async def test_401_refreshes_once_and_resends(self, google_service, monkeypatch):
+        """Test that a rejected token is refreshed and the request resent with the new one."""
+        tokens = []
+
+        def handler(request):
+            tokens.append(request.headers['authorization'])
+            if request.headers['authorization'] == 'Bearer token-1':
+                return httpx.Response(401, json={'error': {'code': 401}})
+            return httpx.Response(200, json={'id': 'ev1'})
+
+        def refresh(self, request):
+            self.token = 'token-2'
+
+        monkeypatch.setattr(Credentials, 'refresh', refresh)
+        _connect(google_service, handler)
+
+        result = await google_service._execute(google_service.service.events().get(calendarId='cal', eventId='ev1'))
+
+        assert result == {'id': 'ev1'}
+        assert tokens == ['Bearer token-1', 'Bearer token-2']
+
+    async def test_401_without_refresh_token_is_not_retried(self, google_service, monkeypatch):
+        """Test that access-only credentials surface the 401 instead of refreshing."""
+        monkeypatch.setattr(Credentials, 'refresh', lambda self, request: pytest.fail('refreshed'))
+        _connect(
+            google_service, lambda request: httpx.Response(401, json={'error': {'code': 401}}),
+            refresh_token=None
+        )
+
+        with pytest.raises(HttpError) as excinfo:
+            await google_service._execute(google_service.service.events().get(calendarId='cal', eventId='ev1'))
+
+        assert excinfo.value.resp.status == 401
+
+
+class TestGoogleEventPages:
+    """Tests for events.list pagination."""
+
+    async def test_change_set_merges_all_pages(self, google_service):
+        """Test that every page is fetched and cancelled items become deletions."""
+        pages = {
+            None: {'items': [_server_event(id='ev1'), {'id': 'gone', 'status': 'cancelled'}],
+                   'nextPageToken': 'p2'},
+            'p2': {'items': [_server_event(id='ev2')], 'nextSyncToken': 'sync-2'},
+        }
+        sent = []
+
+        def handler(request):
+            sent.append(request.url.params)
+            return httpx.Response(200, json=pages[request.url.params.get('pageToken')])
+
+        _connect(google_service, handler)
+        change_set = await google_service.get_change_set('cal', sync_token='sync-1')
+
+        assert set(change_set.changed) == {'ev1', 'ev2'}
+        assert change_set.deleted_native_ids == {'gone'}
+        assert change_set.next_sync_token == 'sync-2'
+        assert [params.get('syncToken') for params in sent] == ['sync-1', 'sync-1']
+
+    async def test_next_page_is_requested_before_current_is_consumed(self, google_service):
+        """Test that the following page is already in flight while a page is processed."""
+        sent = []
+
+        def handler(request):
+            token = request.url.params.get('pageToken')
+            sent.append(token)
+            return httpx.Response(200, json={'items': [], 'nextPageToken': None if token else 'p2'})
+
+        _connect(google_service, handler)
+        pages = google_service._iter_event_pages('cal', None, None, None, None, 'sync-1')
+        try:
+            await pages.__anext__()
+            for _ in range(20):
+                if len(sent) == 2:
+                    break
+                await asyncio.sleep(0)
+            assert sent == [None, 'p2']
+        finally:
+            await pages.aclose()
+
+    async def test_result_cap_skips_prefetch(self, google_service):
+        """Test that a capped listing satisfied by the first page requests no more."""
+        sent = []
+
+        def handler(request):
+            sent.append(request.url.params)
+            return httpx.Response(200, json={
+                'items': [_server_event(id='ev1'), _server_event(id='ev2')], 'nextPageToken': 'p2'
+            })
+
+        _connect(google_service, handler)
+        events = [event async for event in google_service.get_events('cal', max_results=1)]
+
+        assert [event.id for event in events] == ['ev1']
+        assert len(sent) == 1
+        assert sent[0]['maxResults'] == '1'
+
+
+class TestGoogleCalendarMetadata:
+    """Tests for the calendars.get metadata cache."""
+
+    async def test_expired_entry_is_revalidated_with_etag(self, google_service):
+        """Test that a stale entry sends If-None-Match and a 304 keeps the cached data."""
+        sent = []
+
+        def handler(request):
+            sent.append(request.headers.get('if-none-match'))
+            if len(sent) == 1:
+                return httpx.Response(200, json={'id': 'cal', 'etag': '"e1"', 'summary': 'Work'})
+            return httpx.Response(304)
+
+        _connect(google_service, handler)
+        first = await google_service._get_calendar_metadata('cal')
+        assert await google_service._get_calendar_metadata('cal') is first
+        assert len(sent) == 1
+
+        google_service._calendar_meta_cache['cal'] = (
+            time.monotonic() - CALENDAR_CACHE_TTL_SECONDS - 1, first
+        )
+        assert await google_service._get_calendar_metadata('cal') == first
+        assert sent == [None, '"e1"']
+        # The 304 renewed the entry, so the next call is served from cache
+        await google_service._get_calendar_metadata('cal')
+        assert len(sent) == 2
+
+
+class TestGoogleContentIndex:
+    """Tests for the per-day index behind _find_events_by_content."""
+
+    async def test_day_window_is_listed_once_and_refreshed_on_miss(self, google_service):
+        """Test that lookups share one listing per day and a miss reloads it."""
+        items = [
+            _server_event(id='ev1', summary='Standup'),
+            _server_event(id='ev2', summary='Lunch', start={'date': '2024-03-05'}, end={'date': '2024-03-06'}),
+        ]
+        sent = []
+
+        def handler(request):
+            sent.append(request.url.params)
+            return httpx.Response(200, json={'items': list(items)})
+
+        _connect(google_service, handler)
+        standup = await google_service._find_events_by_content('cal', _local_event(summary='  STANDUP '))
+        lunch = await google_service._find_events_by_content(
+            'cal', _local_event(
+                summary='Lunch', all_day=True,
+                start=datetime(2024, 3, 5, tzinfo=timezone.utc), end=datetime(2024, 3, 6, tzinfo=timezone.utc)
+            )
+        )
+
+        assert [event['id'] for event in standup] == ['ev1']
+        assert [event['id'] for event in lunch] == ['ev2']
+        assert len(sent) == 1
+        assert sent[0]['timeMin'].startswith('2024-03-04T00:00:00')
+        assert sent[0]['timeMax'].startswith('2024-03-07T00:00:00')
+
+        items.append(_server_event(id='ev3', summary='Review'))
+        review = await google_service._find_events_by_content('cal', _local_event(summary='Review'))
+
+        assert [event['id'] for event in review] == ['ev3']
+        assert len(sent) == 2
+
+    async def test_deleted_event_is_not_served_from_the_index(self, google_service):
+        """Test that a delete drops the calendar's cached indexes."""
+        items = [_server_event(id='ev1')]
+        lists = []
+
+        def handler(request):
+            if request.method == 'DELETE':
+                items.clear()
+                return httpx.Response(204)
+            lists.append(request)
+            return httpx.Response(200, json={'items': list(items)})
+
+        _connect(google_service, handler)
+        assert await google_service._find_events_by_content('cal', _local_event())
+        await google_service.delete_event('cal', 'ev1')
+
+        assert await google_service._find_events_by_content('cal', _local_event()) == []
+        assert len(lists) == 2
+
+    async def test_update_drops_old_and_new_days(self, google_service):
+        """Test that moving an event to another day forgets both days' indexes."""
+        google_service._content_index_cache.update({
+            ('cal', '2024-03-05'): {}, ('cal', '2024-03-07'): {}, ('cal', '2024-03-09'): {}
+        })
+
+        def handler(request):
+            if request.method == 'GET':
+                return httpx.Response(200, json=_server_event())
+            return httpx.Response(200, json=_server_event(
+                start={'dateTime': '2024-03-07T09:00:00Z'}, end={'dateTime': '2024-03-07T09:30:00Z'}
+            ))
+
+        _connect(google_service, handler)
+        await google_service.update_event('cal', 'ev1', _local_event(
+            start=datetime(2024, 3, 7, 9, 0, tzinfo=timezone.utc),
+            end=datetime(2024, 3, 7, 9, 30, tzinfo=timezone.utc)
+        ))
+
+        assert set(google_service._content_index_cache) == {('cal', '2024-03-09')}
@@ -1,3 +1,7 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
 import pytz
 from datetime import datetime
 
@@ -46,3 +50,58 @@ def test_orphaned_override_clears_recurrence(tmp_path):
     standalone = grouped['override1']['master']
     assert standalone.recurrence_overrides == []
     assert getattr(standalone, 'recurring_event_id', None) is None
+
+
+def _pair(n):
+    return SimpleNamespace(
+        google_calendar_id=f'g{n}', icloud_calendar_id=f'i{n}',
+        google_calendar_name=f'G{n}', icloud_calendar_name=f'I{n}'
+    )
+
+
+async def test_calendar_pairs_sync_concurrently(tmp_path, monkeypatch):
+    engine = SyncEngine(make_settings(tmp_path))
+    engine.db_manager.init_db()
+    engine._services_authenticated = True
+    running = []
+    overlapped = []
+
+    async def get_mappings():
+        return [_pair(1), _pair(2), _pair(3)]
+
+    async def sync_pair(google_id, icloud_id, mapping, *args):
+        running.append(google_id)
+        await asyncio.sleep(0.01)
+        overlapped.append(len(running))
+        running.remove(google_id)
+
+    monkeypatch.setattr(engine, '_get_or_create_calendar_mappings', get_mappings)
+    monkeypatch.setattr(engine, '_sync_calendar_pair', sync_pair)
+
+    report = await engine.sync_calendars()
+
+    assert max(overlapped) == 3
+    assert report.completed_at is not None
+
+
+async def test_failed_pair_fails_sync_after_others_finish(tmp_path, monkeypatch):
+    engine = SyncEngine(make_settings(tmp_path))
+    engine.db_manager.init_db()
+    engine._services_authenticated = True
+    finished = []
+
+    async def get_mappings():
+        return [_pair(1), _pair(2)]
+
+    async def sync_pair(google_id, icloud_id, mapping, *args):
+        if google_id == 'g1':
+            raise RuntimeError('pair failed')
+        await asyncio.sleep(0.01)
+        finished.append(google_id)
+
+    monkeypatch.setattr(engine, '_get_or_create_calendar_mappings', get_mappings)
+    monkeypatch.setattr(engine, '_sync_calendar_pair', sync_pair)
+
+    with pytest.raises(RuntimeError, match='pair failed'):
+        await engine.sync_calendars()
+    assert finished == ['g2']